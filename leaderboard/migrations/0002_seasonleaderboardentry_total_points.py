@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-15 03:25
+
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaderboard', '0001_initial'),
+        ('matches', '0004_rename_away_goals_ft_matchresult_away_goals_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='seasonleaderboardentry',
+            name='leaderboard_season__258c85_idx',
+        ),
+        migrations.AddField(
+            model_name='seasonleaderboardentry',
+            name='total_points',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('tips_points'), '+', models.F('bonus_points')), output_field=models.PositiveIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='seasonleaderboardentry',
+            index=models.Index(fields=['season', '-total_points', '-tips_points', 'user'], name='lb_total_idx'),
+        ),
+    ]
@@ -17,6 +17,11 @@ class SeasonLeaderboardEntry(models.Model):
 
     tips_points = models.PositiveIntegerField(default=0)
     bonus_points = models.PositiveIntegerField(default=0)
+    total_points = models.GeneratedField(
+        expression=models.F("tips_points") + models.F("bonus_points"),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
 
     computed_at = models.DateTimeField(auto_now=True)
 
@@ -25,12 +30,10 @@ class SeasonLeaderboardEntry(models.Model):
             models.UniqueConstraint(fields=["season", "user"], name="uniq_season_user_leaderboard_entry"),
         ]
         indexes = [
-            models.Index(fields=["season", "-tips_points", "-bonus_points", "-computed_at"]),
+            models.Index(fields=["season", "-total_points", "-tips_points", "user"], name="lb_total_idx"),
         ]
 
-    @property
-    def total_points(self) -> int:
-        return self.tips_points + self.bonus_points
-    
     def __str__(self) -> str:
-        return f"SeasonLeaderboardEntry(season={self.season_id}, user={self.user_id}, total={self.total_points})"
\ No newline at end of file
+        # total_points is generated by the database and cannot be read before the first save.
+        total = self.tips_points + self.bonus_points if self.pk is None else self.total_points
+        return f"SeasonLeaderboardEntry(season={self.season_id}, user={self.user_id}, total={total})"
\ No newline at end of file
@@ -4,19 +4,14 @@ from tips.models import Tip, MatchdayBonusTip
 from dataclasses import dataclass
 from typing import Iterable
 
+from django.db.models import Case, F, Sum, Value, When
+from django.db.models.functions import Coalesce, Sign
+from django.db.models.lookups import Exact
+
 EXACT_SCORE_POINTS = 5
 TENDENCY_POINTS = 2
 FIRST_GOAL_MINUTE_POINTS = 3
 
-def _tendency(home: int, away: int) -> int:
-    diff = home - away
-    if diff > 0:
-        return 1
-    elif diff < 0:
-        return -1
-    
-    return 0
-
 def score_tip(
     *,
     tip: Tip,
@@ -36,7 +31,9 @@ def score_tip(
     if predicted_home == actual_home and predicted_away == actual_away:
         return EXACT_SCORE_POINTS
     
-    if _tendency(predicted_home, predicted_away) == _tendency(actual_home, actual_away):
+    actual_diff = actual_home - actual_away
+    predicted_diff = predicted_home - predicted_away
+    if (actual_diff > 0) - (actual_diff < 0) == (predicted_diff > 0) - (predicted_diff < 0):
         return TENDENCY_POINTS
     
     return 0
@@ -54,6 +51,39 @@ def score_matchday_bonus(
     
     return 0
 
+def tip_points_expression() -> Case:
+    """
+    SQL equivalent of score_tip, evaluated on a Tip queryset.
+    Tips without a (complete) result fall through to 0 because NULL never compares equal.
+    """
+    return Case(
+        When(
+            match__result__home_goals=F("home_goals_predicted"),
+            match__result__away_goals=F("away_goals_predicted"),
+            then=Value(EXACT_SCORE_POINTS),
+        ),
+        When(
+            Exact(
+                Sign(F("match__result__home_goals") - F("match__result__away_goals")),
+                Sign(F("home_goals_predicted") - F("away_goals_predicted")),
+            ),
+            then=Value(TENDENCY_POINTS),
+        ),
+        default=Value(0),
+    )
+
+def bonus_points_expression() -> Case:
+    """
+    SQL equivalent of score_matchday_bonus, evaluated on a MatchdayBonusTip queryset.
+    """
+    return Case(
+        When(
+            first_goal_minute_predicted=F("matchday__first_goal_minute"),
+            then=Value(FIRST_GOAL_MINUTE_POINTS),
+        ),
+        default=Value(0),
+    )
+
 @dataclass(frozen=True)
 class UserScoreBreakdown:
     tips_points: int
@@ -71,25 +101,25 @@ def compute_user_score_for_season(
     bonus_tips: Iterable[MatchdayBonusTip] | None = None,
 ) -> UserScoreBreakdown:
     if tips is None:
-        tips = (
+        tips_points = (
             Tip.objects
-            .select_related("match", "match__result", "match__matchday", "match__matchday__season")
             .filter(user=user, match__matchday__season=season)
+            .aggregate(points=Coalesce(Sum(tip_points_expression()), Value(0)))["points"]
         )
+    else:
+        tips_points = sum(score_tip(tip=tip, match=tip.match) for tip in tips)
+
     if bonus_tips is None:
-        bonus_tips = (
+        bonus_points = (
             MatchdayBonusTip.objects
-            .select_related("matchday", "matchday__season")
             .filter(user=user, matchday__season=season)
+            .aggregate(points=Coalesce(Sum(bonus_points_expression()), Value(0)))["points"]
+        )
+    else:
+        bonus_points = sum(
+            score_matchday_bonus(bonus_tip=bonus_tip, matchday=bonus_tip.matchday)
+            for bonus_tip in bonus_tips
         )
-    
-    tips_points = 0
-    for tip in tips:
-        tips_points += score_tip(tip=tip, match=tip.match)
-
-    bonus_points = 0
-    for bonus_tip in bonus_tips:
-        bonus_points += score_matchday_bonus(bonus_tip=bonus_tip, matchday=bonus_tip.matchday)
 
     return UserScoreBreakdown(
         tips_points=tips_points,
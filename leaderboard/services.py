@@ -2,14 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import F, Value
-from django.db.models.functions import Coalesce
+from django.db.models import Sum
 
 from matches.models import Season
 from leaderboard.models import SeasonLeaderboardEntry
-from leaderboard.scoring import score_tip, score_matchday_bonus
+from leaderboard.scoring import bonus_points_expression, tip_points_expression
 from tips.models import Tip, MatchdayBonusTip
 
 
@@ -22,12 +20,12 @@ class LeaderboardRow:
     bonus_points: int
 
 
-def _display_name(user) -> str:
-    for attr in ("username", "email"):
-        val = getattr(user, attr, None)
-        if isinstance(val, str) and val.strip():
-            return val
-    return str(user.pk)
+def _display_name(*, username: str | None, email: str | None, user_id: int) -> str:
+    if username and username.strip():
+        return username
+    if email and email.strip():
+        return email
+    return str(user_id)
 
 
 def compute_leaderboard_for_season(*, season: Season, include_zero: bool = False) -> list[LeaderboardRow]:
@@ -36,30 +34,25 @@ def compute_leaderboard_for_season(*, season: Season, include_zero: bool = False
     """
     qs = (
         SeasonLeaderboardEntry.objects
-        .select_related("user")
         .filter(season=season)
-        .annotate(
-            total_points_db=(
-                Coalesce(F("tips_points"), Value(0)) + Coalesce(F("bonus_points"), Value(0))
-            )
-        )
-        .order_by("-total_points_db", "-tips_points", "user_id")
+        .values("user_id", "tips_points", "bonus_points", "total_points", "user__username", "user__email")
+        .order_by("-total_points", "-tips_points", "user_id")
     )
 
-    rows: list[LeaderboardRow] = []
-    for entry in qs:
-        user = entry.user
-        rows.append(
-            LeaderboardRow(
-                user_id=user.pk,
-                display_name=_display_name(user),
-                points=int(entry.total_points_db),
-                tips_points=int(entry.tips_points),
-                bonus_points=int(entry.bonus_points),
-            )
+    return [
+        LeaderboardRow(
+            user_id=row["user_id"],
+            display_name=_display_name(
+                username=row["user__username"],
+                email=row["user__email"],
+                user_id=row["user_id"],
+            ),
+            points=row["total_points"],
+            tips_points=row["tips_points"],
+            bonus_points=row["bonus_points"],
         )
-
-    return rows
+        for row in qs.iterator(chunk_size=2000)
+    ]
 
 
 @transaction.atomic
@@ -67,96 +60,47 @@ def recompute_leaderboard_for_season(*, season: Season) -> int:
     """
     Recompute the leaderboard entries for the given season.
     """
-    User = get_user_model()
-
-    tips = (
+    tips_points_by_user: dict[int, int] = dict(
         Tip.objects
-        .select_related(
-            "user",
-            "match",
-            "match__result",
-            "match__matchday",
-            "match__matchday__season",
-        )
         .filter(match__matchday__season=season)
-        .only(
-            "id",
-            "user_id",
-            "home_goals_predicted",
-            "away_goals_predicted",
-            "match_id",
-        )
+        .order_by()
+        .values("user_id")
+        .annotate(points=Sum(tip_points_expression()))
+        .values_list("user_id", "points")
+        .iterator(chunk_size=2000)
     )
 
-    bonus_tips = (
+    bonus_points_by_user: dict[int, int] = dict(
         MatchdayBonusTip.objects
-        .select_related("user", "matchday", "matchday__season")
         .filter(matchday__season=season)
-        .only("id", "user_id", "matchday_id", "first_goal_minute_predicted")
+        .order_by()
+        .values("user_id")
+        .annotate(points=Sum(bonus_points_expression()))
+        .values_list("user_id", "points")
+        .iterator(chunk_size=2000)
     )
 
-    tips_points_by_user: dict[int, int] = {}
-    bonus_points_by_user: dict[int, int] = {}
-
-    user_ids: set[int] = set()
-
-    for tip in tips:
-        user_ids.add(int(tip.user_id))
-        tips_points_by_user[int(tip.user_id)] = tips_points_by_user.get(int(tip.user_id), 0) + score_tip(
-            tip=tip,
-            match=tip.match,
-        )
-
-    for bt in bonus_tips:
-        user_ids.add(int(bt.user_id))
-        bonus_points_by_user[int(bt.user_id)] = bonus_points_by_user.get(int(bt.user_id), 0) + score_matchday_bonus(
-            bonus_tip=bt,
-            matchday=bt.matchday,
-        )
+    user_ids: set[int] = set(tips_points_by_user) | set(bonus_points_by_user)
 
     if not user_ids:
         return 0
 
-    existing_user_ids = set(
-        User.objects.filter(id__in=user_ids).values_list("id", flat=True)
+    entries = [
+        SeasonLeaderboardEntry(
+            season=season,
+            user_id=uid,
+            tips_points=tips_points_by_user.get(uid, 0),
+            bonus_points=bonus_points_by_user.get(uid, 0),
+        )
+        for uid in user_ids
+    ]
+
+    SeasonLeaderboardEntry.objects.bulk_create(
+        entries,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["season", "user"],
+        update_fields=["tips_points", "bonus_points", "computed_at"],
     )
-    if not existing_user_ids:
-        return 0
 
-    existing_entries = {
-        (e.user_id): e
-        for e in SeasonLeaderboardEntry.objects
-        .select_for_update()
-        .filter(season=season, user_id__in=existing_user_ids)
-    }
-
-    to_create: list[SeasonLeaderboardEntry] = []
-    to_update: list[SeasonLeaderboardEntry] = []
-
-    for uid in existing_user_ids:
-        t_pts = int(tips_points_by_user.get(uid, 0))
-        b_pts = int(bonus_points_by_user.get(uid, 0))
-
-        entry = existing_entries.get(uid)
-        if entry is None:
-            to_create.append(
-                SeasonLeaderboardEntry(
-                    season=season,
-                    user_id=uid,
-                    tips_points=t_pts,
-                    bonus_points=b_pts,
-                )
-            )
-        else:
-            if int(entry.tips_points) != t_pts or int(entry.bonus_points) != b_pts:
-                entry.tips_points = t_pts
-                entry.bonus_points = b_pts
-                to_update.append(entry)
-
-    if to_create:
-        SeasonLeaderboardEntry.objects.bulk_create(to_create, batch_size=500)
-
-    if to_update:
-        SeasonLeaderboardEntry.objects.bulk_update(to_update, ["tips_points", "bonus_points"], batch_size=500)
-
-    return len(to_create) + len(to_update)
+    return len(entries)
@@ -1,3 +1,155 @@
+from datetime import datetime
+from itertools import product
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from leaderboard.scoring import (
+    bonus_points_expression,
+    score_matchday_bonus,
+    score_tip,
+    tip_points_expression,
+)
+from leaderboard.models import SeasonLeaderboardEntry
+from leaderboard.services import compute_leaderboard_for_season, recompute_leaderboard_for_season
+from matches.models import League, Match, Matchday, MatchResult, Season, Team
+from tips.models import MatchdayBonusTip, Tip
+
+GOALS = range(4)
+
+
+class ScoringExpressionTests(TestCase):
+    """
+    The SQL scoring expressions must agree with the Python score_* functions.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        league = League.objects.create(shortcut="bl1")
+        cls.season = Season.objects.create(league=league, year=2025)
+        home = Team.objects.create(openligadb_team_id=1, name="Home")
+        away = Team.objects.create(openligadb_team_id=2, name="Away")
+        now = timezone.now()
+        cls.matchday = Matchday.objects.create(season=cls.season, order_id=1, deadline_at=now)
+        users = {
+            (h, a): get_user_model().objects.create(username=f"u{h}{a}")
+            for h, a in product(GOALS, GOALS)
+        }
+
+        # One match per actual result (plus one without a result), one tip per prediction.
+        actuals = [*product(GOALS, GOALS), None]
+        for match_id, actual in enumerate(actuals, start=1):
+            match = Match.objects.create(
+                openligadb_match_id=match_id,
+                matchday=cls.matchday,
+                kickoff_at=now,
+                home_team=home,
+                away_team=away,
+            )
+            if actual is not None:
+                MatchResult.objects.create(match=match, home_goals=actual[0], away_goals=actual[1])
+            Tip.objects.bulk_create(
+                Tip(user=user, match=match, home_goals_predicted=h, away_goals_predicted=a)
+                for (h, a), user in users.items()
+            )
+
+    def test_tip_points_expression_matches_score_tip(self):
+        tips = (
+            Tip.objects
+            .select_related("match__result")
+            .annotate(points=tip_points_expression())
+        )
+        self.assertEqual(len(tips), 17 * 16)
+        for tip in tips:
+            with self.subTest(tip=tip):
+                self.assertEqual(tip.points, score_tip(tip=tip, match=tip.match))
+
+    def test_tip_points_expression_ignores_incomplete_result(self):
+        MatchResult.objects.filter(match__openligadb_match_id=1).update(away_goals=None)
+        points = (
+            Tip.objects
+            .filter(match__openligadb_match_id=1)
+            .annotate(points=tip_points_expression())
+            .values_list("points", flat=True)
+        )
+        self.assertEqual(set(points), {0})
+
+    def test_bonus_points_expression_matches_score_matchday_bonus(self):
+        for first_goal_minute in (None, 0, 17):
+            Matchday.objects.filter(pk=self.matchday.pk).update(first_goal_minute=first_goal_minute)
+            MatchdayBonusTip.objects.all().delete()
+            MatchdayBonusTip.objects.bulk_create(
+                MatchdayBonusTip(user=user, matchday=self.matchday, first_goal_minute_predicted=minute)
+                for user, minute in zip(get_user_model().objects.order_by("pk"), (0, 17, 45))
+            )
+            bonus_tips = (
+                MatchdayBonusTip.objects
+                .select_related("matchday")
+                .annotate(points=bonus_points_expression())
+            )
+            for bonus_tip in bonus_tips:
+                with self.subTest(first_goal_minute=first_goal_minute, bonus_tip=bonus_tip):
+                    self.assertEqual(
+                        bonus_tip.points,
+                        score_matchday_bonus(bonus_tip=bonus_tip, matchday=bonus_tip.matchday),
+                    )
+
+    def test_recompute_matches_python_scoring(self):
+        recompute_leaderboard_for_season(season=self.season)
+
+        expected: dict[int, int] = {}
+        for tip in Tip.objects.select_related("match__result"):
+            expected[tip.user_id] = expected.get(tip.user_id, 0) + score_tip(tip=tip, match=tip.match)
+
+        rows = compute_leaderboard_for_season(season=self.season)
+        self.assertEqual({row.user_id: row.points for row in rows}, expected)
+        self.assertEqual([row.points for row in rows], sorted(expected.values(), reverse=True))
+
+
+class LeaderboardViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        season = Season.objects.create(league=League.objects.create(shortcut="bl1"), year=2025)
+        user = get_user_model().objects.create(username="tipper")
+        SeasonLeaderboardEntry.objects.create(season=season, user=user, tips_points=7, bonus_points=3)
+        # A fixed, old stamp: the body must not contain anything newer than the version key.
+        cls.computed_at = timezone.make_aware(datetime(2025, 1, 2, 3, 4, 5))
+        SeasonLeaderboardEntry.objects.update(computed_at=cls.computed_at)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_partial_conditional_get(self):
+        url = reverse("leaderboard:season_bl1_partial")
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "tipper")
+        etag = response["ETag"]
+
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=if_none_match)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_cached_body_only_depends_on_the_version_key(self):
+        for url in (reverse("leaderboard:season_bl1"), reverse("leaderboard:season_bl1_partial")):
+            with self.subTest(url=url):
+                body = self.client.get(url).content.decode()
+                self.assertIn("Updated: 2025-01-02 03:04:05", body)
+                self.assertNotIn(timezone.localdate().isoformat(), body)
+
+                cache.clear()
+                self.assertEqual(self.client.get(url).content.decode(), body)
+
 
-# Create your tests here.
+class SeasonLeaderboardEntryTests(TestCase):
+    def test_str_of_unsaved_entry(self):
+        entry = SeasonLeaderboardEntry(season_id=1, user_id=2, tips_points=3, bonus_points=4)
+        self.assertEqual(str(entry), "SeasonLeaderboardEntry(season=1, user=2, total=7)")
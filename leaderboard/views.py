@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.db.models import Max
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 
 from matches.models import League, Season
-from matches.services import get_season_status
+from matches.services import SeasonStatus, get_season_status
 
+from leaderboard.models import SeasonLeaderboardEntry
 from leaderboard.services import compute_leaderboard_for_season
 
+LEADERBOARD_CACHE_TIMEOUT = 3600
+
 
 def _get_latest_season_for_league(*, league_shortcut: str) -> Season | None:
     """
@@ -23,19 +32,85 @@ def _get_latest_season_for_league(*, league_shortcut: str) -> Season | None:
         .first()
     )
 
+def _leaderboard_computed_at(*, season: Season) -> timezone.datetime | None:
+    """
+    When the season's leaderboard entries were last recomputed.
+    """
+    return (
+        SeasonLeaderboardEntry.objects
+        .filter(season=season)
+        .aggregate(m=Max("computed_at"))["m"]
+    )
+
+
+def _leaderboard_version(
+    *,
+    request: HttpRequest,
+    season: Season,
+    status: SeasonStatus,
+    computed_at: timezone.datetime | None,
+) -> str:
+    """
+    Version key for a rendered leaderboard. Entries only change when the leaderboard is
+    recomputed (computed_at), the status badge changes with the season status and
+    the highlighted row depends on the requesting user.
+    """
+    stamp_key = computed_at.timestamp() if computed_at is not None else 0
+    matchday_key = status.active_matchday.pk if status.active_matchday is not None else 0
+    kickoff_key = status.next_kickoff_at.timestamp() if status.next_kickoff_at is not None else 0
+    user_key = request.user.pk if request.user.is_authenticated else 0
+    return f"{season.pk}-{stamp_key}-{status.state}-{matchday_key}-{kickoff_key}-{user_key}"
+
+
+def _render_leaderboard(
+    request: HttpRequest,
+    *,
+    template_name: str,
+    season: Season,
+    status: SeasonStatus,
+    build_context: Callable[[], dict[str, Any]],
+) -> HttpResponse:
+    """
+    Conditional GET + cached HTML for the leaderboard.
+    The leaderboard query only runs when neither the client nor the cache has a fresh copy.
+    The cached body only shows data covered by the version key, e.g. computed_at.
+    """
+    computed_at = _leaderboard_computed_at(season=season)
+    version = _leaderboard_version(request=request, season=season, status=status, computed_at=computed_at)
+    etag = f'"{version}"'
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        body = cache.get_or_set(
+            f"lb:{template_name}:{version}",
+            lambda: render_to_string(
+                template_name,
+                {**build_context(), "computed_at": computed_at},
+                request=request,
+            ),
+            LEADERBOARD_CACHE_TIMEOUT,
+        )
+        response = HttpResponse(body)
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return response
+
+
 def season_leaderboard_bl1_partial(request: HttpRequest) -> HttpResponse:
     season = _get_latest_season_for_league(league_shortcut="bl1")
     if season is None:
         return render(request, "leaderboard/_table.html", {"rows": [], "season": None})
 
-    rows = compute_leaderboard_for_season(season=season)
     status = get_season_status(season=season)
 
-    return render(
+    return _render_leaderboard(
         request,
-        "leaderboard/_table.html",
-        {
-            "rows": rows,
+        template_name="leaderboard/_table.html",
+        season=season,
+        status=status,
+        build_context=lambda: {
+            "rows": compute_leaderboard_for_season(season=season),
             "season": season,
             "status": status,
         },
@@ -56,24 +131,23 @@ def season_leaderboard_bl1(request: HttpRequest) -> HttpResponse:
                 "league_shortcut": "bl1",
                 "season": None,
                 "rows": [],
-                "generated_at": timezone.now(),
                 "empty_reason": "No season found in DB. Run the OpenLigaDB import first.",
             },
             status=200,
         )
 
-    rows = compute_leaderboard_for_season(season=season)
     status = get_season_status(season=season)
 
-    return render(
+    return _render_leaderboard(
         request,
-        "leaderboard/season.html",
-        {
+        template_name="leaderboard/season.html",
+        season=season,
+        status=status,
+        build_context=lambda: {
             "league_shortcut": "bl1",
             "season": season,
-            "rows": rows,
+            "rows": compute_leaderboard_for_season(season=season),
             "status": status,
-            "generated_at": timezone.now(),
             "empty_reason": None,
         },
     )
@@ -5,26 +5,39 @@ from datetime import datetime, timedelta
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional, stdlib fromisoformat otherwise
+    _parse_iso = datetime.fromisoformat
+
 DEFAULT_DEADLINE_HOURS_BEFORE_KICKOFF = 3.5
 
+_DEFAULT_DEADLINE_DELTA = timedelta(hours=DEFAULT_DEADLINE_HOURS_BEFORE_KICKOFF)
+_TZ = timezone.get_default_timezone()
+
 
 def ensure_aware(dt: datetime) -> datetime:
     """
-    Ensure dt is timezone-aware in the current Django timezone (Europe/Berlin).
+    Ensure dt is timezone-aware in the project timezone (TIME_ZONE, Europe/Berlin).
     OpenLigaDB timestamps can be naive.
     """
     if timezone.is_naive(dt):
-        return timezone.make_aware(dt, timezone.get_current_timezone())
+        return timezone.make_aware(dt, _TZ)
     return dt
 
 
 def parse_openligadb_datetime(value: str) -> datetime:
     """
     Parse OpenLigaDB datetime string into a timezone-aware datetime.
+    OpenLigaDB emits ISO 8601, so a C-level ISO parser (ciso8601 if installed, else
+    fromisoformat) handles the common case.
     """
-    dt = parse_datetime(value)
-    if dt is None:
-        raise ValueError(f"Could not parse datetime from OpenLigaDB value: {value!r}")
+    try:
+        dt = _parse_iso(value)
+    except ValueError:
+        dt = parse_datetime(value)
+        if dt is None:
+            raise ValueError(f"Could not parse datetime from OpenLigaDB value: {value!r}")
     return ensure_aware(dt)
 
 
@@ -37,4 +50,6 @@ def compute_deadline_before_kickoff(
     Deadline = hours_before (default 3.5) hours before the first kickoff of the matchday.
     """
     earliest_kickoff = ensure_aware(earliest_kickoff)
+    if hours_before == DEFAULT_DEADLINE_HOURS_BEFORE_KICKOFF:
+        return earliest_kickoff - _DEFAULT_DEADLINE_DELTA
     return earliest_kickoff - timedelta(hours=hours_before)
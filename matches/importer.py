@@ -1,20 +1,41 @@
 # matches/importer.py
 from __future__ import annotations
 
+import heapq
+import io
+import json
+import logging
+import os
+import sys
+import time
 from dataclasses import dataclass
 from datetime import timedelta
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
 from matches.import_utils import parse_openligadb_datetime, compute_deadline_before_kickoff
 from matches.openligadb_client import OpenLigaDbClient
 from matches.models import League, Season, Matchday, Team, Match, MatchResult
+from matches.services import invalidate_season_status
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_FINAL_KEYWORDS = ("end", "ende", "final")
+
+_PAYLOAD_CACHE_TTL_SECONDS = 3600
+
+# Rows per INSERT ... ON CONFLICT statement. Override with OPENLIGA_BULK_BATCH to stay below
+# the database's bind-parameter / packet limits.
+BULK_CREATE_BATCH_SIZE = int(os.getenv("OPENLIGA_BULK_BATCH", "500"))
+
+
+@dataclass(slots=True)
 class ImportSummary:
     league: str
     season: int
@@ -22,6 +43,7 @@ class ImportSummary:
     groups_total: int = 0
     groups_with_matches: int = 0
     matches_total: int = 0
+    matches_skipped: int = 0
 
     teams_created: int = 0
     teams_updated: int = 0
@@ -32,46 +54,14 @@ class ImportSummary:
 
     groups_imported: int = 0
 
-def _require_int(value: Any, *, err: str) -> int:
-    if not isinstance(value, int):
-        raise KeyError(err)
-    return value
-
-def _require_str(value: Any, *, err: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise KeyError(err)
-    return value
-
-def _match_id(match_json: dict[str, Any]) -> int:
-    return _require_int(
-        match_json.get("matchID"),
-        err=f"Missing matchID in match JSON: keys={list(match_json.keys())}",
-    )
-
-def _group_order_id(match_json: dict[str, Any]) -> int:
-    group = match_json.get("group")
-    if not isinstance(group, dict):
-        raise KeyError(f"Missing group for matchID={match_json.get('matchID')}")
-    return _require_int(
-        group.get("groupOrderID"),
-        err=f"Missing group/groupOrderID for matchID={match_json.get('matchID')}",
-    )
-
-def _kickoff_at(match_json: dict[str, Any]) -> timezone.datetime:
-    raw = _require_str(
-        match_json.get("matchDateTime"),
-        err=f"Missing matchDateTime for matchID={match_json.get('matchID')}",
-    )
-    return parse_openligadb_datetime(raw)
-
 def _is_finished(match_json: dict[str, Any]) -> bool:
     return match_json.get("matchIsFinished") is True
 
 def _extract_team_fields(team_json: dict[str, Any]) -> tuple[int, str, str, str]:
-    team_id = _require_int(
-        team_json.get("teamId"),
-        err=f"Missing teamId in team JSON: keys={list(team_json.keys())}",
-    )
+    try:
+        team_id = int(team_json["teamId"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise KeyError(f"Missing teamId in team JSON: keys={list(team_json.keys())}") from e
 
     name = (team_json.get("teamName") or "").strip()
     short_name = (team_json.get("shortName") or "").strip()
@@ -79,6 +69,73 @@ def _extract_team_fields(team_json: dict[str, Any]) -> tuple[int, str, str, str]
 
     return team_id, name, short_name, icon_url
 
+@dataclass(slots=True)
+class ParsedMatch:
+    """
+    The fields of one OpenLigaDB match JSON the importer needs, parsed once.
+    """
+    openligadb_match_id: int
+    md_order: int
+    kickoff_at: timezone.datetime
+    home_fields: tuple[int, str, str, str]
+    away_fields: tuple[int, str, str, str]
+    is_finished: bool
+    match_json: dict[str, Any]
+
+def _parse_match(match_json: dict[str, Any]) -> ParsedMatch:
+    # Field access is inlined here: this runs once per match of the season.
+    get = match_json.get
+    match_id = get("matchID")
+
+    team1 = get("team1")
+    team2 = get("team2")
+    if not isinstance(team1, dict) or not isinstance(team2, dict):
+        raise KeyError(f"Missing team1/team2 data for matchID={match_id}")
+
+    if not isinstance(match_id, int):
+        raise KeyError(f"Missing matchID in match JSON: keys={list(match_json.keys())}")
+
+    group = get("group")
+    if not isinstance(group, dict):
+        raise KeyError(f"Missing group for matchID={match_id}")
+    md_order = group.get("groupOrderID")
+    if not isinstance(md_order, int):
+        raise KeyError(f"Missing group/groupOrderID for matchID={match_id}")
+
+    raw_kickoff = get("matchDateTime")
+    if not isinstance(raw_kickoff, str) or not raw_kickoff.strip():
+        raise KeyError(f"Missing matchDateTime for matchID={match_id}")
+
+    return ParsedMatch(
+        openligadb_match_id=match_id,
+        md_order=md_order,
+        kickoff_at=parse_openligadb_datetime(raw_kickoff),
+        home_fields=_extract_team_fields(team1),
+        away_fields=_extract_team_fields(team2),
+        is_finished=get("matchIsFinished") is True,
+        match_json=match_json,
+    )
+
+def _index_matches(
+    matches: list[dict[str, Any]],
+    *,
+    log_prefix: str,
+    summary: ImportSummary,
+) -> list[ParsedMatch]:
+    """
+    Parse every match JSON once; malformed matches are reported and skipped.
+    """
+    parsed: list[ParsedMatch] = []
+    for match in matches:
+        if not isinstance(match, dict):
+            continue
+        try:
+            parsed.append(_parse_match(match))
+        except (KeyError, ValueError) as e:
+            summary.matches_skipped += 1
+            logger.warning("[%s] skip match id=%s: %s", log_prefix, match.get("matchID"), e)
+    return parsed
+
 def _extract_current_score(match_json: dict[str, Any]) -> tuple[int, int] | None:
     """
     Returns (home_goals, away_goals) if any score is available, else None.
@@ -87,14 +144,13 @@ def _extract_current_score(match_json: dict[str, Any]) -> tuple[int, int] | None
     1) goals (live progression) -> last goal has scoreTeam1/scoreTeam2
     2) matchResults -> prefer final-ish resultName (end/final), else highest resultOrderID
     """
-    goals = match_json.get("goals") or []
-    if isinstance(goals, list) and goals:
-        last = goals[-1]
-        if isinstance(last, dict):
-            home = last.get("scoreTeam1")
-            away = last.get("scoreTeam2")
-            if isinstance(home, int) and isinstance(away, int):
-                return home, away
+    goals = match_json.get("goals")
+    if goals:
+        try:
+            last = goals[-1]
+            return int(last["scoreTeam1"]), int(last["scoreTeam2"])
+        except (TypeError, KeyError, ValueError, IndexError):
+            pass
 
     results = match_json.get("matchResults") or []
     if not isinstance(results, list) or not results:
@@ -104,24 +160,9 @@ def _extract_current_score(match_json: dict[str, Any]) -> tuple[int, int] | None
         v = d.get(key)
         return v if isinstance(v, int) else None
 
-    finals: list[tuple[int, int, int]] = []
-    for r in results:
-        if not isinstance(r, dict):
-            continue
-        name = (r.get("resultName") or "").strip().lower()
-        if any(k in name for k in ("end", "ende", "final")):
-            h = _int(r, "pointsTeam1")
-            a = _int(r, "pointsTeam2")
-            oid = r.get("resultOrderID")
-            oid_int = oid if isinstance(oid, int) else -1
-            if h is not None and a is not None:
-                finals.append((h, a, oid_int))
-
-    if finals:
-        finals.sort(key=lambda t: t[2])
-        h, a, _ = finals[-1]
-        return h, a
-
+    # One pass: track the best "final" result and the highest resultOrderID at the same time.
+    final: tuple[int, int] | None = None
+    final_oid = -1
     best: dict[str, Any] | None = None
     best_oid = -1
     for r in results:
@@ -133,6 +174,17 @@ def _extract_current_score(match_json: dict[str, Any]) -> tuple[int, int] | None
             best_oid = oid_int
             best = r
 
+        name = (r.get("resultName") or "").lower()
+        if any(k in name for k in _FINAL_KEYWORDS):
+            h = _int(r, "pointsTeam1")
+            a = _int(r, "pointsTeam2")
+            if h is not None and a is not None and (final is None or oid_int >= final_oid):
+                final = (h, a)
+                final_oid = oid_int
+
+    if final is not None:
+        return final
+
     if not best:
         return None
 
@@ -166,163 +218,386 @@ def _compute_matchday_first_goal(
     *,
     matchday_obj: Matchday,
     match_rows: list[tuple[Match, dict[str, Any]]],
-) -> None:
+) -> list[str]:
     """
-    Computes and stores:
+    Computes (without saving):
       - matchday.first_goal_at     (absolute timestamp)
       - matchday.first_goal_match  (FK to Match)
       - matchday.first_goal_minute (minute within that match)
 
+    Returns the names of the fields that changed, so the caller can persist them
+    together with its own changes in a single save.
+
     "First goal of matchday" means: chronologically first goal across all matches of that matchday.
     We approximate absolute time as kickoff_at + matchMinute.
     """
-    best: tuple[timezone.datetime, Match, int] | None = None  
-
-    for match_obj, match_json in match_rows:
-        minute = _extract_first_goal_minute_for_match(match_json)
-        if minute is None:
-            continue
-
-        goal_at = match_obj.kickoff_at + timedelta(minutes=minute)
-
-        if best is None or goal_at < best[0]:
-            best = (goal_at, match_obj, minute)
+    first_goal_fields = ["first_goal_at", "first_goal_match", "first_goal_minute"]
+    # Matches without goals are dropped before any timedelta arithmetic happens.
+    with_minute = [
+        (match_obj, minute)
+        for match_obj, match_json in match_rows
+        if match_json.get("goals") and (minute := _extract_first_goal_minute_for_match(match_json)) is not None
+    ]
+    best: tuple[timezone.datetime, Match, int] | None = min(
+        ((match_obj.kickoff_at + timedelta(minutes=minute), match_obj, minute) for match_obj, minute in with_minute),
+        key=itemgetter(0),
+        default=None,
+    )
 
     if best is None:
         if (
             matchday_obj.first_goal_at is not None
-            or matchday_obj.first_goal_match is not None
+            or matchday_obj.first_goal_match_id is not None
             or matchday_obj.first_goal_minute is not None
         ):
             matchday_obj.first_goal_at = None
             matchday_obj.first_goal_match = None
             matchday_obj.first_goal_minute = None
-            matchday_obj.save(update_fields=["first_goal_at", "first_goal_match", "first_goal_minute"])
-        return
+            return first_goal_fields
+        return []
 
     goal_at, match_obj, minute = best
 
-    current_match_pk = matchday_obj.first_goal_match.pk if matchday_obj.first_goal_match else None
-
     if (
         matchday_obj.first_goal_at != goal_at
-        or current_match_pk != match_obj.pk
+        or matchday_obj.first_goal_match_id != match_obj.pk
         or matchday_obj.first_goal_minute != minute
     ):
         matchday_obj.first_goal_at = goal_at
         matchday_obj.first_goal_match = match_obj # type: ignore[type-arg]
         matchday_obj.first_goal_minute = minute
-        matchday_obj.save(update_fields=["first_goal_at", "first_goal_match", "first_goal_minute"])
+        return first_goal_fields
+
+    return []
 
 
-def _upsert_team(*, team_id: int, name: str, short_name: str, icon_url: str) -> tuple[Team, bool, bool]:
+def _collect_team_payload(parsed: list[ParsedMatch]) -> dict[int, tuple[str, str, str]]:
     """
-    Returns (team, created, updated).
+    Returns team_id -> (name, short_name, icon_url) for every team of the parsed matches.
+    Reuses the team fields extracted by _parse_match; the first occurrence of a team wins
+    (walking the matches backwards lets later duplicates be overwritten by earlier ones).
     """
-    team, created = Team.objects.get_or_create(
-        openligadb_team_id=team_id,
-        defaults={"name": name, "short_name": short_name, "icon_url": icon_url},
-    )
+    return {
+        team_id: (name, short_name, icon_url)
+        for pm in reversed(parsed)
+        for team_id, name, short_name, icon_url in (pm.away_fields, pm.home_fields)
+    }
 
-    if created:
-        return team, True, False
 
-    updated_fields: list[str] = []
+def _bulk_upsert_teams(*, team_payload: dict[int, tuple[str, str, str]], summary: ImportSummary) -> None:
+    """
+    Insert new teams and update changed ones with a single INSERT ... ON CONFLICT.
+    An empty incoming name never overwrites a stored one.
+    """
+    if not team_payload:
+        return
+
+    existing: dict[int, tuple[str, str, str]] = {
+        team_id: (name, short_name, icon_url)
+        for team_id, name, short_name, icon_url in Team.objects
+        .filter(openligadb_team_id__in=team_payload.keys())
+        .values_list("openligadb_team_id", "name", "short_name", "icon_url")
+    }
 
-    if name and team.name != name:
-        team.name = name
-        updated_fields.append("name")
+    to_upsert: list[Team] = []
+    created = updated = 0
 
-    if team.short_name != short_name:
-        team.short_name = short_name
-        updated_fields.append("short_name")
+    for team_id, (name, short_name, icon_url) in team_payload.items():
+        current = existing.get(team_id)
+        if current is None:
+            created += 1
+        else:
+            name = name or current[0]
+            if current == (name, short_name, icon_url):
+                continue
+            updated += 1
 
-    if team.icon_url != icon_url:
-        team.icon_url = icon_url
-        updated_fields.append("icon_url")
+        to_upsert.append(
+            Team(openligadb_team_id=team_id, name=name, short_name=short_name, icon_url=icon_url)
+        )
 
-    if updated_fields:
-        team.save(update_fields=updated_fields)
-        return team, False, True
+    if to_upsert:
+        Team.objects.bulk_create(
+            to_upsert,
+            batch_size=BULK_CREATE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["openligadb_team_id"],
+            update_fields=["name", "short_name", "icon_url"],
+        )
 
-    return team, False, False
+    summary.teams_created += created
+    summary.teams_updated += updated
 
 
-@transaction.atomic
-def _upsert_match_result(*, match_obj: Match, match_json: dict[str, Any], summary: ImportSummary | None = None) -> None:
+def _team_pks(team_payload: dict[int, tuple[str, str, str]]) -> dict[int, int]:
+    """
+    Returns openligadb_team_id -> Team.pk for the given payload, without building model instances.
+    """
+    return dict(
+        Team.objects
+        .filter(openligadb_team_id__in=team_payload.keys())
+        .values_list("openligadb_team_id", "pk")
+    )
+
+
+def _bulk_upsert_match_results(
+    *,
+    match_rows: list[tuple[Match, dict[str, Any]]],
+    summary: ImportSummary | None = None,
+) -> None:
     """
     Invariant: MatchResult exists only if a score exists.
+    One SELECT for the existing results, one upsert for new/changed scores and one
+    DELETE for matches that lost their score.
     Honest counting:
     - results_created increments only on first create
-    - results_updated increments only when FT score actually changed
+    - results_updated increments only when the score actually changed
     """
-    score = _extract_current_score(match_json)
+    new_scores: dict[int, tuple[int, int]] = {}
+    to_delete_ids: list[int] = []
 
-    if score is None:
-        MatchResult.objects.filter(match=match_obj).delete()
+    for match_obj, match_json in match_rows:
+        score = _extract_current_score(match_json)
+        if score is None:
+            to_delete_ids.append(match_obj.pk)
+        else:
+            new_scores[match_obj.pk] = score
+
+    if to_delete_ids:
+        MatchResult.objects.filter(match_id__in=to_delete_ids).delete()
+
+    if not new_scores:
         return
 
-    home_goals, away_goals = score
+    existing: dict[int, tuple[int | None, int | None]] = {
+        match_id: (home_goals, away_goals)
+        for match_id, home_goals, away_goals in MatchResult.objects
+        .filter(match_id__in=new_scores.keys())
+        .values_list("match_id", "home_goals", "away_goals")
+    }
+
+    to_upsert: list[MatchResult] = []
+    created = updated = 0
+
+    for match_id, (home_goals, away_goals) in new_scores.items():
+        current = existing.get(match_id)
+        if current == (home_goals, away_goals):
+            continue
+
+        if current is None:
+            created += 1
+        else:
+            updated += 1
+
+        to_upsert.append(MatchResult(match_id=match_id, home_goals=home_goals, away_goals=away_goals))
+
+    if to_upsert:
+        MatchResult.objects.bulk_create(
+            to_upsert,
+            batch_size=BULK_CREATE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["match"],
+            update_fields=["home_goals", "away_goals"],
+        )
+
+    if summary:
+        summary.results_created += created
+        summary.results_updated += updated
 
-    existing = (
-        MatchResult.objects
-        .filter(match=match_obj)
-        .only("home_goals", "away_goals")
-        .first()
+def _bulk_upsert_matches(
+    *,
+    match_rows: list[tuple[Match, dict[str, Any]]],
+    summary: ImportSummary,
+) -> list[tuple[Match, dict[str, Any]]]:
+    """
+    Insert or update all given (unsaved) matches with a single INSERT ... ON CONFLICT
+    keyed on openligadb_match_id. Returns the rows de-duplicated by match id
+    (last payload wins), with primary keys set on the Match instances.
+    """
+    rows_by_id: dict[int, tuple[Match, dict[str, Any]]] = {}
+    for match_obj, match_json in match_rows:
+        rows_by_id[match_obj.openligadb_match_id] = (match_obj, match_json)
+
+    if not rows_by_id:
+        return []
+
+    existing_ids = set(
+        Match.objects
+        .filter(openligadb_match_id__in=rows_by_id.keys())
+        .values_list("openligadb_match_id", flat=True)
     )
 
-    if existing is not None:
-        if existing.home_goals == home_goals and existing.away_goals == away_goals:
-            return
+    Match.objects.bulk_create(
+        [match_obj for match_obj, _ in rows_by_id.values()],
+        batch_size=BULK_CREATE_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["openligadb_match_id"],
+        update_fields=["matchday", "kickoff_at", "home_team", "away_team", "is_finished"],
+    )
 
-        existing.home_goals = home_goals
-        existing.away_goals = away_goals
-        existing.save(update_fields=["home_goals", "away_goals"])
+    summary.matches_created += len(rows_by_id) - len(existing_ids)
+    summary.matches_updated += len(existing_ids)
 
-        if summary:
-            summary.results_updated += 1
-        return
+    return list(rows_by_id.values())
 
-    MatchResult.objects.create(
-        match=match_obj,
-        home_goals=home_goals,
-        away_goals=away_goals,
+def _bulk_upsert_matchdays(
+    *,
+    season: Season,
+    matchdays: dict[int, Matchday],
+    summary: ImportSummary,
+) -> None:
+    """
+    Insert new matchdays and rename changed ones with a single INSERT ... ON CONFLICT.
+    `matchdays` maps order_id to an unsaved Matchday of `season`.
+    The deadline is only set on insert; existing deadlines are left untouched.
+    """
+    existing: dict[int, str] = dict(
+        Matchday.objects
+        .filter(season=season, order_id__in=matchdays.keys())
+        .values_list("order_id", "name")
     )
 
-    if summary:
-        summary.results_created += 1
+    to_upsert = [md for md_order, md in matchdays.items() if existing.get(md_order) != md.name]
+
+    if to_upsert:
+        Matchday.objects.bulk_create(
+            to_upsert,
+            batch_size=BULK_CREATE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["season", "order_id"],
+            update_fields=["name"],
+        )
 
-def _compute_earliest_kickoffs(matches: list[dict[str, Any]]) -> dict[int, timezone.datetime]:
+    summary.groups_imported += len(matchdays.keys() - existing.keys())
+
+def _compute_earliest_kickoffs(parsed: list[ParsedMatch]) -> dict[int, timezone.datetime]:
     """
     Return earliest kickoff per matchday order_id.
     """
     earliest_by_matchday: dict[int, timezone.datetime] = {}
 
-    for match in matches:
-        if not isinstance(match, dict):
-            continue
-        try:
-            md_order = _group_order_id(match)
-            kickoff = _kickoff_at(match)
-        except KeyError:
-            continue
-
-        current = earliest_by_matchday.get(md_order)
-        if current is None or kickoff < current:
-            earliest_by_matchday[md_order] = kickoff
+    for pm in parsed:
+        current = earliest_by_matchday.get(pm.md_order)
+        if current is None or pm.kickoff_at < current:
+            earliest_by_matchday[pm.md_order] = pm.kickoff_at
 
     return earliest_by_matchday
 
-def bootstrap_season(*, client: OpenLigaDbClient, league_shortcut: str, season_year: int, dry_run: bool = False) -> ImportSummary:
-    summary = ImportSummary(league=league_shortcut, season=season_year)
+def _format_dry_run_report(
+    *,
+    summary: ImportSummary,
+    sample: list[tuple[int, timezone.datetime]],
+) -> str:
+    """
+    Renders the bootstrap dry-run report as one string, so it is written in a single call.
+    """
+    buf = io.StringIO()
+    buf.write(f"[bootstrap] league={summary.league} season={summary.season}\n")
+    buf.write(f"groups: {summary.groups_total}, with matches: {summary.groups_with_matches}\n")
+    buf.write(f"matches: {summary.matches_total}\n")
+    if sample:
+        buf.write("sample deadlines (matchday -> deadline_at):\n")
+        for md_order, deadline in sample:
+            buf.write(f"  {md_order:>2} -> {deadline.isoformat()}\n")
+    return buf.getvalue()
+
+
+def _payload_cache_dir(*, dry_run: bool, force_cache: bool) -> Path | None:
+    """
+    The payload cache is opt-in: used when OPENLIGADB_CACHE_DIR is configured, or for dry runs
+    and --force-cache, which fall back to a project-owned directory (never the shared temp dir).
+    Returns None when the cache is not used.
+    """
+    configured = getattr(settings, "OPENLIGADB_CACHE_DIR", None)
+    if configured:
+        return Path(configured)
+    if dry_run or force_cache:
+        return Path(settings.BASE_DIR) / ".cache" / "openligadb"
+    return None
+
+
+def _read_cached_payload(cache_dir: Path, key: str, *, force_cache: bool) -> Any | None:
+    """
+    Returns the cached JSON payload for key, or None if missing, unreadable or older than the TTL.
+    With force_cache the TTL is ignored.
+    """
+    path = cache_dir / f"{key}.json"
+    try:
+        if not force_cache and time.time() - path.stat().st_mtime > _PAYLOAD_CACHE_TTL_SECONDS:
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_payload(cache_dir: Path, key: str, data: Any) -> None:
+    path = cache_dir / f"{key}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        logger.warning("[bootstrap] could not write payload cache %s: %s", path, e)
+
+
+def _fetch_season_payload(
+    *,
+    client: OpenLigaDbClient,
+    league_shortcut: str,
+    season_year: int,
+    dry_run: bool,
+    force_cache: bool,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Returns (matches, groups) of a season, served from the disk cache when it is enabled and possible.
+
+    Without force_cache a cached payload is only used while every match in it is finished,
+    so a running season is always fetched fresh.
+    """
+    cache_dir = _payload_cache_dir(dry_run=dry_run, force_cache=force_cache)
+    key = f"{league_shortcut}_{season_year}"
+    if cache_dir is not None:
+        matches = _read_cached_payload(cache_dir, f"{key}_matches", force_cache=force_cache)
+        groups = _read_cached_payload(cache_dir, f"{key}_groups", force_cache=force_cache)
+        if isinstance(matches, list) and isinstance(groups, list):
+            if force_cache or (matches and all(isinstance(m, dict) and _is_finished(m) for m in matches)):
+                return matches, groups
 
     matches = client.fetch_matches_season(league_shortcut, season_year)
+    groups = client.fetch_available_groups(league_shortcut, season_year)
+    if cache_dir is not None:
+        _write_cached_payload(cache_dir, f"{key}_matches", matches)
+        _write_cached_payload(cache_dir, f"{key}_groups", groups)
+    return matches, groups
+
+
+@transaction.atomic
+def bootstrap_season(
+    *,
+    client: OpenLigaDbClient,
+    league_shortcut: str,
+    season_year: int,
+    dry_run: bool = False,
+    force_cache: bool = False,
+) -> ImportSummary:
+    summary = ImportSummary(league=league_shortcut, season=season_year)
+
+    # Both API calls happen before the first query, so no DB transaction is held open over the network.
+    matches, groups = _fetch_season_payload(
+        client=client,
+        league_shortcut=league_shortcut,
+        season_year=season_year,
+        dry_run=dry_run,
+        force_cache=force_cache,
+    )
     summary.matches_total = len(matches)
+    summary.groups_total = len(groups)
 
     league_name = (matches[0].get("leagueName") or "") if matches else ""
 
+    parsed = _index_matches(matches, log_prefix="bootstrap", summary=summary)
+
     league_obj = season_obj = None
-    seen_team_ids: set[int] = set()
+    team_payload = _collect_team_payload(parsed)
 
     if not dry_run:
         league_obj, created = League.objects.get_or_create(
@@ -335,34 +610,12 @@ def bootstrap_season(*, client: OpenLigaDbClient, league_shortcut: str, season_y
 
         season_obj, _ = Season.objects.get_or_create(league=league_obj, year=season_year)
 
-        for match in matches:
-            for key in ("team1", "team2"):
-                team_json = match.get(key)
-                if not isinstance(team_json, dict):
-                    continue
-
-                team_id, name, short_name, icon_url = _extract_team_fields(team_json)
-                if team_id in seen_team_ids:
-                    continue
-                seen_team_ids.add(team_id)
-
-                _, t_created, t_updated = _upsert_team(
-                    team_id=team_id,
-                    name=name,
-                    short_name=short_name,
-                    icon_url=icon_url,
-                )
-                if t_created:
-                    summary.teams_created += 1
-                elif t_updated:
-                    summary.teams_updated += 1
-
-    earliest_by_matchday = _compute_earliest_kickoffs(matches)
+        _bulk_upsert_teams(team_payload=team_payload, summary=summary)
 
-    groups = client.fetch_available_groups(league_shortcut, season_year)
-    summary.groups_total = len(groups)
+    earliest_by_matchday = _compute_earliest_kickoffs(parsed)
 
-    deadlines: dict[int, timezone.datetime] = {}
+    # Unsaved matchdays keyed by order_id; season is None in a dry run.
+    incoming_matchdays: dict[int, Matchday] = {}
 
     for group in groups:
         md_order = group.get("groupOrderID") or group.get("groupOrderId")
@@ -373,102 +626,84 @@ def bootstrap_season(*, client: OpenLigaDbClient, league_shortcut: str, season_y
         if earliest is None:
             continue
 
-        deadline = compute_deadline_before_kickoff(earliest)
-        deadlines[md_order] = deadline
-
-        if dry_run:
-            continue
-
-        assert season_obj is not None
-        matchday_obj, created = Matchday.objects.get_or_create(
+        incoming_matchdays[md_order] = Matchday(
             season=season_obj,
             order_id=md_order,
-            defaults={
-                "name": group.get("groupName") or "",
-                "deadline_at": deadline,
-            },
+            name=group.get("groupName") or "",
+            deadline_at=compute_deadline_before_kickoff(earliest),
         )
 
-        new_name = group.get("groupName") or ""
-        if not created and matchday_obj.name != new_name:
-            matchday_obj.name = new_name
-            matchday_obj.save(update_fields=["name"])
+    summary.groups_with_matches = len(incoming_matchdays)
 
-        if created:
-            summary.groups_imported += 1
-
-    summary.groups_with_matches = len(deadlines)
+    if not dry_run:
+        assert season_obj is not None
+        _bulk_upsert_matchdays(season=season_obj, matchdays=incoming_matchdays, summary=summary)
 
     if dry_run:
-        sample = sorted(deadlines.items(), key=lambda item: item[0])[:5]
-        print(f"[bootstrap] league={league_shortcut} season={season_year}")
-        print(f"groups: {summary.groups_total}, with matches: {summary.groups_with_matches}")
-        print(f"matches: {summary.matches_total}")
-        if sample:
-            print("sample deadlines (matchday -> deadline_at):")
-            for md_order, deadline in sample:
-                print(f"  {md_order:>2} -> {deadline.isoformat()}")
+        sample = heapq.nsmallest(
+            5,
+            ((md.order_id, md.deadline_at) for md in incoming_matchdays.values()),
+            key=itemgetter(0),
+        )
+        sys.stdout.write(_format_dry_run_report(summary=summary, sample=sample))
         return summary
 
     assert season_obj is not None
 
-    matchday_by_order: dict[int, Matchday] = {md.order_id: md for md in Matchday.objects.filter(season=season_obj)}
-    team_by_id: dict[int, Team] = {
-        team.openligadb_team_id: team
-        for team in Team.objects.filter(openligadb_team_id__in=seen_team_ids)
+    # Only the columns needed for Match construction and the first-goal update.
+    matchday_by_order: dict[int, Matchday] = {
+        md.order_id: md
+        for md in Matchday.objects
+        .filter(season=season_obj)
+        .only("id", "order_id", "first_goal_at", "first_goal_match", "first_goal_minute")
     }
+    team_pk_by_id = _team_pks(team_payload)
 
-    matchday_rows: dict[int, list[tuple[Match, dict[str, Any]]]] = {}
-
-    for match in matches:
-        if not isinstance(match, dict):
-            continue
+    match_rows: list[tuple[Match, dict[str, Any]]] = []
 
+    for pm in parsed:
         try:
-            openligadb_match_id = _match_id(match)
-            md_order = _group_order_id(match)
-            kickoff_at = _kickoff_at(match)
-
-            team1 = match.get("team1")
-            team2 = match.get("team2")
-            if not isinstance(team1, dict) or not isinstance(team2, dict):
-                raise KeyError("Missing team1/team2 data")
-
-            home_id, *_ = _extract_team_fields(team1)
-            away_id, *_ = _extract_team_fields(team2)
-
-            matchday_obj = matchday_by_order[md_order]
-            home_team = team_by_id[home_id]
-            away_team = team_by_id[away_id]
-        except Exception as e:
-            print(f"[bootstrap] skip match due to missing data: {e}")
+            matchday_id = matchday_by_order[pm.md_order].pk
+            home_team_id = team_pk_by_id[pm.home_fields[0]]
+            away_team_id = team_pk_by_id[pm.away_fields[0]]
+        except KeyError as e:
+            summary.matches_skipped += 1
+            logger.warning("[bootstrap] skip match id=%s: missing %s", pm.openligadb_match_id, e)
             continue
 
-        match_obj, created = Match.objects.update_or_create(
-            openligadb_match_id=openligadb_match_id,
-            defaults={
-                "matchday": matchday_obj,
-                "kickoff_at": kickoff_at,
-                "home_team": home_team,
-                "away_team": away_team,
-                "is_finished": _is_finished(match),
-            },
+        match_rows.append(
+            (
+                Match(
+                    openligadb_match_id=pm.openligadb_match_id,
+                    matchday_id=matchday_id,
+                    kickoff_at=pm.kickoff_at,
+                    home_team_id=home_team_id,
+                    away_team_id=away_team_id,
+                    is_finished=pm.is_finished,
+                ),
+                pm.match_json,
+            )
         )
 
-        if created:
-            summary.matches_created += 1
-        else:
-            summary.matches_updated += 1
+    matchday_rows: dict[int, list[tuple[Match, dict[str, Any]]]] = {}
 
-        _upsert_match_result(match_obj=match_obj, match_json=match, summary=summary)
+    match_rows = _bulk_upsert_matches(match_rows=match_rows, summary=summary)
+    _bulk_upsert_match_results(match_rows=match_rows, summary=summary)
 
-        matchday_rows.setdefault(md_order, []).append((match_obj, match))
+    for match_obj, match in match_rows:
+        matchday_rows.setdefault(match_obj.matchday_id, []).append((match_obj, match))
 
-    for md_order, rows in matchday_rows.items():
-        md_obj = matchday_by_order.get(md_order)
+    matchday_by_pk = {md.pk: md for md in matchday_by_order.values()}
+    for matchday_id, rows in matchday_rows.items():
+        md_obj = matchday_by_pk.get(matchday_id)
         if md_obj is None:
             continue
-        _compute_matchday_first_goal(matchday_obj=md_obj, match_rows=rows)
+        changed_fields = _compute_matchday_first_goal(matchday_obj=md_obj, match_rows=rows)
+        if changed_fields:
+            md_obj.save(update_fields=changed_fields)
+
+    season_id = season_obj.pk
+    transaction.on_commit(lambda: invalidate_season_status(season_id=season_id))
 
     return summary
 
@@ -489,39 +724,33 @@ def _get_season_or_raise(*, league_shortcut: str, season_year: int) -> Season:
         raise RuntimeError(f"Season {league_shortcut} {season_year} not found. Run bootstrap_season first.") from e
 
 
-def _compute_earliest_kickoff(matches: list[dict[str, Any]]) -> timezone.datetime | None:
-    earliest: timezone.datetime | None = None
-    for m in matches:
-        if not isinstance(m, dict):
-            continue
-        try:
-            kickoff = _kickoff_at(m)
-        except Exception:
-            continue
-        if earliest is None or kickoff < earliest:
-            earliest = kickoff
-    return earliest
+def _compute_earliest_kickoff(parsed: list[ParsedMatch]) -> timezone.datetime | None:
+    return min((pm.kickoff_at for pm in parsed), default=None)
 
 
 def _ensure_matchday(
     *,
     season: Season,
     group_json: dict[str, Any],
-    matches_in_group: list[dict[str, Any]],
+    parsed: list[ParsedMatch],
     summary: ImportSummary,
-) -> Matchday | None:
+) -> tuple[Matchday, list[str]] | None:
+    """
+    Returns the (row-locked) matchday and the names of fields changed but not yet saved.
+    Must be called inside a transaction.
+    """
     group_id = group_json.get("groupOrderID") or group_json.get("groupOrderId")
     if not isinstance(group_id, int):
         return None
 
-    earliest = _compute_earliest_kickoff(matches_in_group)
+    earliest = _compute_earliest_kickoff(parsed)
     if earliest is None:
         return None
 
     deadline = compute_deadline_before_kickoff(earliest)
     name = (group_json.get("groupName") or "").strip()
 
-    matchday, created = Matchday.objects.get_or_create(
+    matchday, created = Matchday.objects.select_for_update().get_or_create(
         season=season,
         order_id=group_id,
         defaults={
@@ -530,14 +759,16 @@ def _ensure_matchday(
         },
     )
 
+    changed_fields: list[str] = []
+
     if created:
         summary.groups_imported += 1
     else:
         if name and matchday.name != name:
             matchday.name = name
-            matchday.save(update_fields=["name"])
+            changed_fields.append("name")
 
-    return matchday
+    return matchday, changed_fields
 
 
 @transaction.atomic
@@ -549,96 +780,57 @@ def _import_one_matchday(
     last_changed_at: timezone.datetime,
     summary: ImportSummary,
 ) -> None:
-    matchday = _ensure_matchday(
+    parsed = _index_matches(matches_in_group, log_prefix="update", summary=summary)
+
+    ensured = _ensure_matchday(
         season=season,
         group_json=group_json,
-        matches_in_group=matches_in_group,
+        parsed=parsed,
         summary=summary,
     )
-    if matchday is None:
+    if ensured is None:
         return
 
-    matchday = Matchday.objects.select_for_update().get(pk=matchday.pk)
-
-    seen_team_ids: set[int] = set()
-
-    for m in matches_in_group:
-        if not isinstance(m, dict):
-            continue
-        for key in ("team1", "team2"):
-            team_json = m.get(key)
-            if not isinstance(team_json, dict):
-                continue
+    matchday, changed_fields = ensured
 
-            team_id, name, short_name, icon_url = _extract_team_fields(team_json)
-            if team_id in seen_team_ids:
-                continue
-            seen_team_ids.add(team_id)
+    team_payload = _collect_team_payload(parsed)
+    _bulk_upsert_teams(team_payload=team_payload, summary=summary)
 
-            _, created, updated = _upsert_team(
-                team_id=team_id,
-                name=name,
-                short_name=short_name,
-                icon_url=icon_url,
-            )
-            if created:
-                summary.teams_created += 1
-            elif updated:
-                summary.teams_updated += 1
-
-    team_by_id: dict[int, Team] = {
-        t.openligadb_team_id: t
-        for t in Team.objects.filter(openligadb_team_id__in=seen_team_ids)
-    }
+    team_pk_by_id = _team_pks(team_payload)
 
     match_rows: list[tuple[Match, dict[str, Any]]] = []
 
-    for m in matches_in_group:
-        if not isinstance(m, dict):
-            continue
-
+    for pm in parsed:
         try:
-            openligadb_match_id = _match_id(m)
-            kickoff_at = _kickoff_at(m)
-
-            team1 = m.get("team1")
-            team2 = m.get("team2")
-            if not isinstance(team1, dict) or not isinstance(team2, dict):
-                raise KeyError("Missing team1/team2")
-
-            home_id, *_ = _extract_team_fields(team1)
-            away_id, *_ = _extract_team_fields(team2)
-
-            home_team = team_by_id[home_id]
-            away_team = team_by_id[away_id]
-        except Exception as e:
-            print(f"[update] skip match due to missing data: {e}")
+            home_team_id = team_pk_by_id[pm.home_fields[0]]
+            away_team_id = team_pk_by_id[pm.away_fields[0]]
+        except KeyError as e:
+            summary.matches_skipped += 1
+            logger.warning("[update] skip match id=%s: missing %s", pm.openligadb_match_id, e)
             continue
 
-        match_obj, created = Match.objects.update_or_create(
-            openligadb_match_id=openligadb_match_id,
-            defaults={
-                "matchday": matchday,
-                "kickoff_at": kickoff_at,
-                "home_team": home_team,
-                "away_team": away_team,
-                "is_finished": _is_finished(m),
-            },
+        match_rows.append(
+            (
+                Match(
+                    openligadb_match_id=pm.openligadb_match_id,
+                    matchday_id=matchday.pk,
+                    kickoff_at=pm.kickoff_at,
+                    home_team_id=home_team_id,
+                    away_team_id=away_team_id,
+                    is_finished=pm.is_finished,
+                ),
+                pm.match_json,
+            )
         )
 
-        if created:
-            summary.matches_created += 1
-        else:
-            summary.matches_updated += 1
-
-        _upsert_match_result(match_obj=match_obj, match_json=m, summary=summary)
-
-        match_rows.append((match_obj, m))
+    match_rows = _bulk_upsert_matches(match_rows=match_rows, summary=summary)
+    _bulk_upsert_match_results(match_rows=match_rows, summary=summary)
 
-    _compute_matchday_first_goal(matchday_obj=matchday, match_rows=match_rows)
+    changed_fields += _compute_matchday_first_goal(matchday_obj=matchday, match_rows=match_rows)
 
     matchday.openligadb_last_changed_at = last_changed_at
-    matchday.save(update_fields=["openligadb_last_changed_at"])
+    changed_fields.append("openligadb_last_changed_at")
+    matchday.save(update_fields=changed_fields)
 
 def update_season_smart(
     *,
@@ -647,6 +839,7 @@ def update_season_smart(
     season_year: int,
     dry_run: bool = False,
     last_changed_workers: int = 10,
+    fetch_workers: int = 10,
 ) -> ImportSummary:
     """
     Smart update of season data by checking lastChanged timestamps of matchdays.
@@ -658,12 +851,16 @@ def update_season_smart(
     groups = client.fetch_available_groups(league_shortcut, season_year)
     summary.groups_total = len(groups)
 
+    # More workers than pooled connections would only block on the pool.
+    last_changed_workers = max(1, min(last_changed_workers, client.pool_maxsize))
+    fetch_workers = max(1, min(fetch_workers, client.pool_maxsize))
+
     def _log(msg: str) -> None:
         print(msg, flush=True)
 
     _log(
         f"[update] league={league_shortcut} season={season_year} "
-        f"groups={summary.groups_total} dry_run={dry_run} workers={last_changed_workers}"
+        f"groups={summary.groups_total} dry_run={dry_run} workers={last_changed_workers}/{fetch_workers}"
     )
 
     group_ids: list[int] = []
@@ -671,7 +868,7 @@ def update_season_smart(
     for idx, g in enumerate(groups, start=1):
         gid = g.get("groupOrderID") or g.get("groupOrderId")
         if not isinstance(gid, int):
-            _log(f"[update] skip group #{idx}: missing groupOrderID/groupOrderId")
+            logger.warning("[update] skip group #%s: missing groupOrderID/groupOrderId", idx)
             continue
         group_ids.append(gid)
         group_by_id[gid] = g
@@ -695,20 +892,21 @@ def update_season_smart(
                 errors.append((gid, str(e)))
 
     if errors:
+        errors.sort()
         for gid, err in errors[:10]:
-            _log(f"[update] lastChanged error group {gid}: {err}")
+            logger.warning("[update] lastChanged error group %s: %s", gid, err)
         if len(errors) > 10:
-            _log(f"[update] ... {len(errors) - 10} more lastChanged errors")
+            logger.warning("[update] ... %s more lastChanged errors", len(errors) - 10)
+
+    db_last_changed_by_gid: dict[int, timezone.datetime | None] = dict(
+        Matchday.objects
+        .filter(season=season, order_id__in=last_changed_map.keys())
+        .values_list("order_id", "openligadb_last_changed_at")
+    )
 
     planned: list[tuple[int, str, timezone.datetime]] = []
     for gid, (raw, dt) in last_changed_map.items():
-        md = (
-            Matchday.objects
-            .filter(season=season, order_id=gid)
-            .only("openligadb_last_changed_at")
-            .first()
-        )
-        db_last_changed = md.openligadb_last_changed_at if md else None
+        db_last_changed = db_last_changed_by_gid.get(gid)
         has_changed = (db_last_changed is None) or (dt > db_last_changed)
         if has_changed:
             planned.append((gid, raw, dt))
@@ -723,17 +921,30 @@ def update_season_smart(
             _log(f"[update]   group {gid:>2} changed at {raw}")
         return summary
 
+    # Fetch all changed matchdays concurrently (network only), then write sequentially.
+    matches_by_gid: dict[int, list[dict[str, Any]]] = {}
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as ex:
+        futures = {
+            ex.submit(client.fetch_matches_matchday, league_shortcut, season_year, gid): gid
+            for gid, _, _ in planned
+        }
+        for fut in as_completed(futures):
+            gid = futures[fut]
+            try:
+                matches_by_gid[gid] = fut.result()
+            except Exception as e:
+                logger.warning("[update] group %s: fetch_matches_matchday failed: %s", gid, e)
+
     matches_seen = 0
 
     for idx, (gid, raw, dt) in enumerate(planned, start=1):
-        _log(f"[update] importing group {gid:>2} ({idx}/{len(planned)}) lastChanged={raw}")
-
-        try:
-            matches_in_group = client.fetch_matches_matchday(league_shortcut, season_year, gid)
-        except Exception as e:
-            _log(f"[update] group {gid}: fetch_matches_matchday failed: {e}")
+        matches_in_group = matches_by_gid.get(gid)
+        if matches_in_group is None:
             continue
 
+        _log(f"[update] importing group {gid:>2} ({idx}/{len(planned)}) lastChanged={raw}")
+
         matches_seen += len(matches_in_group)
 
         _import_one_matchday(
@@ -746,6 +957,9 @@ def update_season_smart(
 
     summary.matches_total = matches_seen
 
+    if planned:
+        invalidate_season_status(season_id=season.pk)
+
     _log(
         f"[update] done: changed_groups={summary.groups_with_matches}, matches_fetched={matches_seen}, "
         f"teams(created={summary.teams_created}, updated={summary.teams_updated}), "
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Any
 
 from django.core.management.base import BaseCommand, CommandParser, CommandError
@@ -19,9 +22,22 @@ def _group_id(group_json: dict[str, Any]) -> int | None:
     gid = group_json.get("groupOrderID") or group_json.get("groupOrderId")
     return gid if isinstance(gid, int) else None
 
+_NAIVE_ISO_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
+
+def _local_kickoff_key(dt: timezone.datetime) -> str:
+    """
+    Naive local ISO string of dt; strings of this shape sort chronologically.
+    """
+    return timezone.localtime(dt, timezone.get_default_timezone()).replace(tzinfo=None).isoformat(timespec="seconds")
+
+
 def _iter_kickoffs_from_matchday_payload(matches: list[dict[str, Any]]):
     """
-    Yield kickoff datetimes from OpenLigaDB matchday match payload.
+    Yield comparable kickoff keys (naive local ISO strings) from OpenLigaDB matchday match payload.
+
+    OpenLigaDB sends naive local timestamps, which already have that shape and are yielded as-is;
+    only other formats (offsets, fractions) are parsed and normalised.
     """
     for match in matches:
         if not isinstance(match, dict):
@@ -31,11 +47,18 @@ def _iter_kickoffs_from_matchday_payload(matches: list[dict[str, Any]]):
         if not isinstance(raw, str) or not raw:
             continue
 
+        if _NAIVE_ISO_RE.fullmatch(raw):
+            yield raw
+            continue
+
         try:
-            yield parse_openligadb_datetime(raw)
+            yield _local_kickoff_key(parse_openligadb_datetime(raw))
         except Exception:
             continue
 
+_LAST_CHANGED_PROBE_WINDOW = timedelta(days=14)
+
+
 def determine_active_season(
     *,
     client: OpenLigaDbClient,
@@ -47,36 +70,91 @@ def determine_active_season(
     Determine the active season year for the given league by inspecting match kickoff times.
     """
     now = now or timezone.now()
+    now_key = _local_kickoff_key(now)
+    years = sorted(candidate_years, reverse=True)
+    max_workers = max(1, client.pool_maxsize)
 
-    best_upcoming: tuple[timezone.datetime, int] | None = None
-    best_recent: tuple[timezone.datetime, int] | None = None
+    def _fetch_groups(year: int) -> list[dict[str, Any]] | None:
+        try:
+            return client.fetch_available_groups(league_shortcut, year)
+        except Exception:
+            return None
 
-    for year in sorted(candidate_years, reverse=True):
+    def _fetch_matchday(pair: tuple[int, int]) -> list[dict[str, Any]] | None:
+        year, gid = pair
         try:
-            groups = client.fetch_available_groups(league_shortcut, year)
+            return client.fetch_matches_matchday(league_shortcut, year, gid)
         except Exception:
+            return None
+
+    def _probe_last_changed(year: int) -> timezone.datetime | None:
+        """
+        lastChanged timestamp of the year's final matchday, or None if unavailable.
+        """
+        groups = _fetch_groups(year)
+        if not groups:
+            return None
+        gids = [gid for group in groups if isinstance(group, dict) and (gid := _group_id(group)) is not None]
+        if not gids:
+            return None
+        try:
+            return parse_openligadb_datetime(client.fetch_last_changed(league_shortcut, year, max(gids)))
+        except Exception:
+            return None
+
+    # Cheap probe: if the newest year with data was changed recently, and more recently than the
+    # year before it, it is the active season and no matchday payload needs to be downloaded.
+    # Group lists are cached by the client, so the full scan below does not refetch them.
+    probed = iter(years)
+    for year in probed:
+        changed = _probe_last_changed(year)
+        if changed is None:
             continue
-
-        for group in groups:
-            if not isinstance(group, dict):
+        if now - _LAST_CHANGED_PROBE_WINDOW <= changed <= now:
+            previous = next((c for y in probed if (c := _probe_last_changed(y)) is not None), None)
+            if previous is None or changed > previous:
+                return year
+        break
+
+    # Kickoffs are compared as naive local ISO strings; none of them needs to be parsed.
+    best_upcoming: tuple[str, int] | None = None
+    best_recent: tuple[str, int] | None = None
+
+    # Newest year first; the matchdays of one year are fetched concurrently.
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for year in years:
+            groups = _fetch_groups(year)
+            if groups is None:
                 continue
 
-            gid = _group_id(group)
-            if gid is None:
-                continue
-
-            try:
-                matchday_matches = client.fetch_matches_matchday(league_shortcut, year, gid)
-            except Exception:
-                continue
-
-            for kickoff in _iter_kickoffs_from_matchday_payload(matchday_matches):
-                if kickoff >= now:
-                    if best_upcoming is None or kickoff < best_upcoming[0]:
-                        best_upcoming = (kickoff, year)
-                else:
-                    if best_recent is None or kickoff > best_recent[0]:
-                        best_recent = (kickoff, year)
+            pairs: list[tuple[int, int]] = []
+            for group in groups:
+                if not isinstance(group, dict):
+                    continue
+                gid = _group_id(group)
+                if gid is not None:
+                    pairs.append((year, gid))
+
+            has_past = has_upcoming = False
+            for matchday_matches in ex.map(_fetch_matchday, pairs):
+                if matchday_matches is None:
+                    continue
+
+                for kickoff in _iter_kickoffs_from_matchday_payload(matchday_matches):
+                    if kickoff >= now_key:
+                        has_upcoming = True
+                        if best_upcoming is None or kickoff < best_upcoming[0]:
+                            best_upcoming = (kickoff, year)
+                    else:
+                        has_past = True
+                        if best_recent is None or kickoff > best_recent[0]:
+                            best_recent = (kickoff, year)
+
+            # A year with both played and upcoming matches is the season in progress. Seasons do
+            # not overlap in practice, so older candidate years are not fetched at all.
+            if has_past and has_upcoming:
+                assert best_upcoming is not None
+                return best_upcoming[1]
 
     if best_upcoming is not None:
         return best_upcoming[1]
@@ -93,22 +171,23 @@ def _resolve_season_year(
     league_shortcut: str,
     requested: int | None,
     client: OpenLigaDbClient,
-) -> tuple[int, str]:
+) -> tuple[int, str, Season | None]:
     """
     Resolve the season year to import for the given league.
+    When the year comes from the DB, the Season row is returned as well so callers can reuse it.
     """
     if requested is not None:
-        return int(requested), "cli"
+        return int(requested), "cli", None
 
-    db_year = (
+    db_season = (
         Season.objects
+        .select_related("league")
         .filter(league__shortcut=league_shortcut)
         .order_by("-year")
-        .values_list("year", flat=True)
         .first()
     )
-    if db_year is not None:
-        return int(db_year), "db"
+    if db_season is not None:
+        return db_season.year, "db", db_season
 
     now = timezone.now()
     candidate_years = [now.year + 1, now.year, now.year - 1]
@@ -118,7 +197,7 @@ def _resolve_season_year(
         candidate_years=candidate_years,
         now=now,
     )
-    return int(api_year), "api"
+    return int(api_year), "api", None
 
 class Command(BaseCommand):
     help = "Imports match data from OpenLigaDB"
@@ -154,6 +233,12 @@ class Command(BaseCommand):
             help="If set, do not write to DB. Only print what would happen (where supported).",
         )
 
+        parser.add_argument(
+            "--force-cache",
+            action="store_true",
+            help="Bootstrap only: reuse the cached season payload from disk even if it is stale or unfinished.",
+        )
+
         parser.add_argument(
             "--timeout",
             type=int,
@@ -165,6 +250,7 @@ class Command(BaseCommand):
         league: str = str(options["league"]).strip().lower()
         mode: str = str(options["mode"]).strip().lower()
         dry_run: bool = bool(options["dry_run"])
+        force_cache: bool = bool(options["force_cache"])
         timeout: int = int(options["timeout"])
 
         self.stdout.write(
@@ -172,12 +258,11 @@ class Command(BaseCommand):
                 f"[import_openligadb] starting league={league} mode={mode} dry_run={dry_run} timeout={timeout}s"
             )
         )
-        self.stdout.flush()
 
         client = OpenLigaDbClient(timeout_seconds=timeout)
 
         try:
-            season_year, season_source = _resolve_season_year(
+            season_year, season_source, season = _resolve_season_year(
                 league_shortcut=league,
                 requested=options.get("season"),
                 client=client,
@@ -187,14 +272,16 @@ class Command(BaseCommand):
 
         if season_source == "api":
             self.stdout.write(self.style.NOTICE("[import_openligadb] season auto-detected via API (slow path)"))
-            self.stdout.flush()
 
         self.stdout.write(
             self.style.NOTICE(
                 f"[import_openligadb] league={league} season={season_year} season_source={season_source} mode={mode} dry_run={dry_run}"
             )
         )
-        self.stdout.flush()
+
+        # Season detection may have cached groups/lastChanged responses; the import itself
+        # starts from fresh data.
+        client.clear_cache()
 
         try:
             if mode == "bootstrap":
@@ -203,6 +290,7 @@ class Command(BaseCommand):
                     season_year=season_year,
                     client=client,
                     dry_run=dry_run,
+                    force_cache=force_cache,
                 )
             elif mode == "smart":
                 summary = update_season_smart(
@@ -225,9 +313,9 @@ class Command(BaseCommand):
                     or summary.groups_with_matches > 0
                 )
             if should_recompute:
-                try:
-                    season = (Season.objects.select_related("league").get(league__shortcut=league, year=season_year))
-                except Season.DoesNotExist:
+                if season is None:
+                    season = Season.objects.select_related("league").filter(league__shortcut=league, year=season_year).first()
+                if season is None:
                     self.stdout.write(
                         self.style.WARNING(
                             f"[import_openligadb] cannot recompute leaderboard: season not found in DB after import: league={league} year={season_year}"
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matches', '0004_rename_away_goals_ft_matchresult_away_goals_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['matchday', 'is_finished', 'kickoff_at'], name='match_md_finished_ko_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(condition=models.Q(('is_finished', False)), fields=['kickoff_at'], name='match_unfinished_ko_idx'),
+        ),
+    ]
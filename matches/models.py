@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Now
 from django.utils import timezone
 from datetime import datetime
 
@@ -30,6 +31,20 @@ class Season(models.Model):
     def __str__(self):
         return f"{self.league.shortcut} {self.year}"
     
+class MatchdayQuerySet(models.QuerySet):
+    def with_open_flag(self):
+        """
+        Annotate is_open (deadline not yet passed), evaluated in SQL against the database clock.
+        Templates read obj.is_open directly; is_open_for_tipping() does not look at it.
+        """
+        return self.annotate(
+            is_open=models.ExpressionWrapper(
+                models.Q(deadline_at__gte=Now()),
+                output_field=models.BooleanField(),
+            )
+        )
+
+
 class Matchday(models.Model):
     """
     Represents a matchday within a season.
@@ -58,6 +73,8 @@ class Matchday(models.Model):
         help_text="The timestamp when the first goal of the matchday was scored.",
     )
 
+    objects = MatchdayQuerySet.as_manager()
+
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=["season", "order_id"], name="uniq_season_matchday_order")
@@ -101,7 +118,14 @@ class Match(models.Model):
         ordering = ["kickoff_at", "id"]
         indexes = [
             models.Index(fields=["matchday", "kickoff_at"]),
-            models.Index(fields=["kickoff_at"])
+            models.Index(fields=["kickoff_at"]),
+            # Live-matchday lookup in get_season_status: unfinished matches by kickoff.
+            models.Index(fields=["matchday", "is_finished", "kickoff_at"], name="match_md_finished_ko_idx"),
+            models.Index(
+                fields=["kickoff_at"],
+                condition=models.Q(is_finished=False),
+                name="match_unfinished_ko_idx",
+            ),
         ]
 
     def __str__(self):
@@ -1,30 +1,143 @@
-from dataclasses import dataclass
+import copy
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json via response.json() otherwise
+    orjson = None
+
+GROUPS_CACHE_TTL_SECONDS = 300
+LAST_CHANGED_CACHE_TTL_SECONDS = 30
+RETRY_BACKOFF_MAX_SECONDS = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe client-side rate limiter: bursts of up to `capacity` requests,
+    refilled at `rate` tokens per second.
+    """
+
+    def __init__(self, *, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CappedRetry(Retry):
+    """
+    Retry that honours Retry-After, but never waits longer than RETRY_BACKOFF_MAX_SECONDS,
+    so one rate-limited response cannot stall every pool worker for as long as the server asks.
+    """
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_BACKOFF_MAX_SECONDS)
+
 
 @dataclass(frozen=True)
 class OpenLigaDbClient:
     base_url: str = "https://api.openligadb.de"
     timeout_seconds: int = 10
+    pool_maxsize: int = 10
+    max_retries: int = 3
+    session: requests.Session = field(default_factory=requests.Session, repr=False, compare=False)
+    rate_limiter: TokenBucket = field(
+        default_factory=lambda: TokenBucket(rate=10.0, capacity=10), repr=False, compare=False
+    )
+    # endpoint -> (expires_at, data) for the groups/lastChanged responses of this client.
+    _cache: dict[str, tuple[float, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # One keep-alive pool shared by all worker threads; sized to the importer's fan-out.
+        # Idempotent GETs are retried with backoff on the same pooled connection: connect/read
+        # failures, server errors and rate limiting (429, honouring a capped Retry-After).
+        retry = CappedRetry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            backoff_factor=0.5,
+            backoff_max=RETRY_BACKOFF_MAX_SECONDS,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Sent with every request of this session instead of per call.
+        self.session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "prediction-game"})
 
     def _get_json(self, endpoint: str) -> Any:
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        self.rate_limiter.acquire()
         try:
-            response = requests.get(url, timeout=self.timeout_seconds)
+            response = self.session.get(url, timeout=self.timeout_seconds)
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
         except requests.Timeout as e:
             raise RuntimeError(f"Request to {url} timed out") from e
         except requests.HTTPError as e:
             raise RuntimeError(f"HTTP error occurred while requesting {url}: {e}") from e
+        except requests.ConnectionError as e:
+            raise RuntimeError(f"Connection to {url} failed after retries: {e}") from e
         except ValueError as e:
             raise RuntimeError(f"Invalid JSON response from {url}") from e
-        
+
+    def _get_json_cached(self, endpoint: str, *, ttl: int) -> Any:
+        """
+        _get_json with a per-client TTL cache. Callers get a copy, so they may mutate the result.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(endpoint)
+        if cached is not None and cached[0] > now:
+            return copy.deepcopy(cached[1])
+
+        data = self._get_json(endpoint)
+        with self._cache_lock:
+            # Expired entries are dropped here, so the cache only holds live responses.
+            for key in [key for key, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                del self._cache[key]
+            self._cache[endpoint] = (now + ttl, data)
+        return copy.deepcopy(data)
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached groups/lastChanged responses.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
     def fetch_available_groups(self, league_shortcut: str, season_year: int) -> list[dict[str, Any]]:
         # GET /getavailablegroups/{leagueShortcut}/{leagueSeason}
         endpoint = f"getavailablegroups/{league_shortcut}/{season_year}"
-        data = self._get_json(endpoint)
+        data = self._get_json_cached(endpoint, ttl=GROUPS_CACHE_TTL_SECONDS)
         if not isinstance(data, list):
             raise RuntimeError(f"Unexpected data format for available groups: {data}")
         return data
@@ -48,7 +161,7 @@ class OpenLigaDbClient:
     def fetch_last_changed(self, league_shortcut: str, season_year: int, group_order_id: int) -> str:
         # GET /getlastchangedate/{leagueShortcut}/{leagueSeason}/{groupOrderID}
         endpoint = f"getlastchangedate/{league_shortcut}/{season_year}/{group_order_id}"
-        data = self._get_json(endpoint)
+        data = self._get_json_cached(endpoint, ttl=LAST_CHANGED_CACHE_TTL_SECONDS)
         if not isinstance(data, str):
             raise RuntimeError(f"Unexpected data format for last changed date: {data}")
         return data
\ No newline at end of file
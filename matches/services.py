@@ -1,7 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from django.core.cache import cache
+from django.db.models import Case, Count, F, Min, Q, Value, When
 from django.utils import timezone
-from matches.models import Season, Matchday, Match
+from matches.models import Season, Matchday
 
 @dataclass(frozen=True)
 class SeasonStatus:
@@ -9,27 +11,77 @@ class SeasonStatus:
     state: str  # "live" | "upcoming" | "idle"
     next_kickoff_at: timezone.datetime | None
 
+SEASON_STATUS_CACHE_MAX_SECONDS = 60
+
+
+def _season_status_cache_key(season_id: int) -> str:
+    return f"season_status:{season_id}"
+
+
+def invalidate_season_status(*, season_id: int) -> None:
+    """
+    Drop the cached status of a season; called by the importer after it wrote match data.
+    With the default per-process cache this only reaches the importing process, so web
+    workers rely on the entry timeout instead.
+    """
+    cache.delete(_season_status_cache_key(season_id))
+
+
 def get_season_status(*, season: Season, now=None) -> SeasonStatus:
-    now = now or timezone.now()
+    """
+    Cached wrapper around _compute_season_status. The status can only change when the next
+    kickoff passes or the importer writes, so entries expire at the next kickoff and after
+    SEASON_STATUS_CACHE_MAX_SECONDS at most. An explicit `now` bypasses the cache.
+    """
+    if now is not None:
+        return _compute_season_status(season=season, now=now)
+
+    key = _season_status_cache_key(season.pk)
+    status = cache.get(key)
+    if status is not None:
+        return status
+
+    now = timezone.now()
+    status = _compute_season_status(season=season, now=now)
 
-    live_matchday = (
+    if status.state != "idle" and status.next_kickoff_at is not None:
+        until_kickoff = int((status.next_kickoff_at - now).total_seconds())
+        timeout = max(5, min(SEASON_STATUS_CACHE_MAX_SECONDS, until_kickoff))
+    else:
+        timeout = SEASON_STATUS_CACHE_MAX_SECONDS
+
+    cache.set(key, status, timeout=timeout)
+    return status
+
+
+def _compute_season_status(*, season: Season, now) -> SeasonStatus:
+    """
+    One grouped query over the season's matchdays:
+    - live:     newest matchday with a kicked-off, unfinished match
+    - upcoming: matchday of the next kickoff
+    - idle:     neither
+    """
+
+    matchday = (
         Matchday.objects
-        .filter(season=season, matches__kickoff_at__lte=now, matches__is_finished=False)
-        .distinct()
-        .order_by("-order_id")
+        .filter(season=season)
+        # Status consumers only use the identity/label columns; keeps the grouped rows and the cached value small.
+        .only("id", "season", "order_id", "name", "deadline_at")
+        .annotate(
+            live_matches=Count("matches", filter=Q(matches__kickoff_at__lte=now, matches__is_finished=False)),
+            next_kickoff=Min("matches__kickoff_at", filter=Q(matches__kickoff_at__gt=now)),
+        )
+        .filter(Q(live_matches__gt=0) | Q(next_kickoff__isnull=False))
+        .annotate(
+            live_order=Case(When(live_matches__gt=0, then=F("order_id")), default=Value(-1)),
+        )
+        .order_by("-live_order", "next_kickoff")
         .first()
     )
-    if live_matchday:
-        return SeasonStatus(active_matchday=live_matchday, state="live", next_kickoff_at=None)
-
-    next_match = (
-        Match.objects
-        .filter(matchday__season=season, kickoff_at__gt=now)
-        .select_related("matchday")
-        .order_by("kickoff_at")
-        .first()
-    )
-    if next_match:
-        return SeasonStatus(active_matchday=next_match.matchday, state="upcoming", next_kickoff_at=next_match.kickoff_at)
+    if matchday is None:
+        return SeasonStatus(active_matchday=None, state="idle", next_kickoff_at=None)
+
+    if matchday.live_matches:
+        return SeasonStatus(active_matchday=matchday, state="live", next_kickoff_at=None)
 
-    return SeasonStatus(active_matchday=None, state="idle", next_kickoff_at=None)
+    return SeasonStatus(active_matchday=matchday, state="upcoming", next_kickoff_at=matchday.next_kickoff)
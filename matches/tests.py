@@ -1,3 +1,143 @@
-from django.test import TestCase
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+
+from matches.importer import bootstrap_season
+from matches.models import Match, MatchResult, Team
+
+
+def _team(team_id: int) -> dict[str, Any]:
+    return {"teamId": team_id, "teamName": f"Team {team_id}", "shortName": f"T{team_id}", "teamIconUrl": ""}
+
+
+def _match(
+    match_id: int,
+    *,
+    group: int = 1,
+    kickoff: str = "2025-08-22T20:30:00",
+    home: int = 1,
+    away: int = 2,
+    finished: bool = False,
+    score: tuple[int, int] | None = None,
+) -> dict[str, Any]:
+    results = []
+    if score is not None:
+        results = [{"resultName": "Endergebnis", "resultOrderID": 2, "pointsTeam1": score[0], "pointsTeam2": score[1]}]
+    return {
+        "matchID": match_id,
+        "group": {"groupOrderID": group, "groupName": f"{group}. Spieltag"},
+        "matchDateTime": kickoff,
+        "team1": _team(home),
+        "team2": _team(away),
+        "matchIsFinished": finished,
+        "leagueName": "1. Bundesliga",
+        "matchResults": results,
+        "goals": [],
+    }
+
+
+class _StubClient:
+    pool_maxsize = 1
+
+    def __init__(self, matches: list[dict[str, Any]]):
+        self.matches = matches
+
+    def fetch_matches_season(self, league_shortcut: str, season_year: int) -> list[dict[str, Any]]:
+        return self.matches
+
+    def fetch_available_groups(self, league_shortcut: str, season_year: int) -> list[dict[str, Any]]:
+        return [{"groupOrderID": 1, "groupName": "1. Spieltag"}, {"groupOrderID": 2, "groupName": "2. Spieltag"}]
+
+
+class BootstrapBulkUpsertTests(TestCase):
+    def _bootstrap(self, matches: list[dict[str, Any]]):
+        return bootstrap_season(client=_StubClient(matches), league_shortcut="bl1", season_year=2025)
+
+    def test_matches_are_updated_in_place(self):
+        summary = self._bootstrap([_match(10), _match(11, home=3, away=4)])
+        self.assertEqual((summary.matches_created, summary.matches_updated), (2, 0))
+        pks = dict(Match.objects.values_list("openligadb_match_id", "pk"))
+
+        summary = self._bootstrap([
+            _match(10, group=2, kickoff="2025-08-30T15:30:00", home=2, away=1, finished=True),
+            _match(11, home=3, away=4),
+        ])
+        self.assertEqual((summary.matches_created, summary.matches_updated), (0, 2))
+        self.assertEqual(dict(Match.objects.values_list("openligadb_match_id", "pk")), pks)
+
+        match = Match.objects.select_related("matchday", "home_team", "away_team").get(openligadb_match_id=10)
+        self.assertEqual(match.matchday.order_id, 2)
+        self.assertTrue(match.is_finished)
+        self.assertEqual((match.home_team.openligadb_team_id, match.away_team.openligadb_team_id), (2, 1))
+
+    def test_duplicate_match_ids_are_upserted_once(self):
+        summary = self._bootstrap([_match(10, home=1, away=2), _match(10, home=3, away=4)])
+        self.assertEqual(summary.matches_created, 1)
+        match = Match.objects.select_related("home_team").get()
+        self.assertEqual(match.home_team.openligadb_team_id, 3)
+
+    def test_results_are_created_updated_and_deleted(self):
+        summary = self._bootstrap([_match(10, score=(1, 0)), _match(11, home=3, away=4, score=(2, 2))])
+        self.assertEqual((summary.results_created, summary.results_updated), (2, 0))
+
+        summary = self._bootstrap([_match(10, score=(1, 1)), _match(11, home=3, away=4, score=(2, 2))])
+        self.assertEqual((summary.results_created, summary.results_updated), (0, 1))
+        self.assertEqual(
+            dict(MatchResult.objects.values_list("match__openligadb_match_id", "home_goals")),
+            {10: 1, 11: 2},
+        )
+        self.assertEqual(MatchResult.objects.get(match__openligadb_match_id=10).away_goals, 1)
+
+        # A match whose score disappears from the payload loses its result row.
+        self._bootstrap([_match(10), _match(11, home=3, away=4, score=(2, 2))])
+        self.assertFalse(MatchResult.objects.filter(match__openligadb_match_id=10).exists())
+        self.assertTrue(MatchResult.objects.filter(match__openligadb_match_id=11).exists())
+
+    def test_bootstrap_after_teams_were_recreated(self):
+        self._bootstrap([_match(10)])
+        Match.objects.all().delete()
+        Team.objects.all().delete()
+
+        summary = self._bootstrap([_match(10)])
+        self.assertEqual(summary.matches_created, 1)
+        match = Match.objects.select_related("home_team").get()
+        self.assertEqual(match.home_team.openligadb_team_id, 1)
+
+
+class PayloadCacheTests(TestCase):
+    def setUp(self):
+        base_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(base_dir.cleanup)
+        self.base_dir = Path(base_dir.name)
+        settings_override = override_settings(BASE_DIR=self.base_dir, OPENLIGADB_CACHE_DIR=None)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _plant(self, cache_dir: Path, matches: list[dict[str, Any]]) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / "bl1_2025_matches.json").write_text(json.dumps(matches), encoding="utf-8")
+        (cache_dir / "bl1_2025_groups.json").write_text(
+            json.dumps(_StubClient([]).fetch_available_groups("bl1", 2025)), encoding="utf-8"
+        )
+
+    def test_cache_is_not_used_by_default(self):
+        cache_dir = self.base_dir / ".cache" / "openligadb"
+        self._plant(cache_dir, [_match(99, finished=True)])
+        planted = (cache_dir / "bl1_2025_matches.json").read_text(encoding="utf-8")
+
+        bootstrap_season(client=_StubClient([_match(10)]), league_shortcut="bl1", season_year=2025)
+
+        self.assertEqual(list(Match.objects.values_list("openligadb_match_id", flat=True)), [10])
+        self.assertEqual((cache_dir / "bl1_2025_matches.json").read_text(encoding="utf-8"), planted)
+
+    def test_force_cache_reads_the_project_cache(self):
+        self._plant(self.base_dir / ".cache" / "openligadb", [_match(99)])
+
+        bootstrap_season(
+            client=_StubClient([_match(10)]), league_shortcut="bl1", season_year=2025, force_cache=True
+        )
+
+        self.assertEqual(list(Match.objects.values_list("openligadb_match_id", flat=True)), [99])
@@ -1,12 +1,41 @@
 from datetime import datetime
 from typing import Any
 
+from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Now
 from django.utils import timezone
 
 
+def matchday_deadline_at(obj: Any) -> datetime:
+    """
+    Deadline of obj.matchday (a Match or MatchdayBonusTip). Uses a select_related matchday if
+    there is one, otherwise reads only deadline_at instead of the whole matchday.
+    """
+    if type(obj).matchday.is_cached(obj):
+        return obj.matchday.deadline_at
+    return (
+        apps.get_model("matches", "Matchday").objects
+        .values_list("deadline_at", flat=True)
+        .get(pk=obj.matchday_id)
+    )
+
+
+class TipQuerySet(models.QuerySet):
+    def with_open_flag(self):
+        """
+        Annotate is_open (the match's matchday deadline not yet passed), evaluated in SQL.
+        """
+        return self.annotate(
+            is_open=models.ExpressionWrapper(
+                models.Q(match__matchday__deadline_at__gte=Now()),
+                output_field=models.BooleanField(),
+            )
+        )
+
+
 class Tip(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -26,6 +55,8 @@ class Tip(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TipQuerySet.as_manager()
+
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=["user", "match"], name="uniq_tip_user_match"),
@@ -48,7 +79,18 @@ class Tip(models.Model):
 
     def is_editable(self, at: datetime | None = None) -> bool:
         now = at or timezone.now()
-        return now <= self.match.matchday.deadline_at
+        return now <= self._deadline_at()
+
+    def _deadline_at(self) -> datetime:
+        # Use a select_related match if there is one, otherwise fetch just the deadline in one join.
+        if Tip.match.is_cached(self):
+            return matchday_deadline_at(self.match)
+        return (
+            apps.get_model("matches", "Match").objects
+            .filter(pk=self.match_id)
+            .values_list("matchday__deadline_at", flat=True)
+            .get()
+        )
 
     def clean(self) -> None:
         errors: dict[str, Any] = {}
@@ -118,4 +160,4 @@ class MatchdayBonusTip(models.Model):
     
     def is_editable(self, at: datetime | None = None) -> bool:
         now = at or timezone.now()
-        return now <= self.matchday.deadline_at
\ No newline at end of file
+        return now <= matchday_deadline_at(self)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -8,7 +9,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from matches.models import Match, Matchday
-from tips.models import MatchdayBonusTip, Tip
+from tips.models import MatchdayBonusTip, Tip, matchday_deadline_at
 
 
 @dataclass(frozen=True)
@@ -18,10 +19,12 @@ class TipUpsertResult:
     updated: bool
 
 
+# No timezone is ever activated per request, so the current timezone is always TIME_ZONE.
+_LOCAL_TZ = timezone.get_default_timezone()
+
+
 def _ensure_aware(dt: datetime) -> datetime:
-    if timezone.is_naive(dt):
-        return timezone.make_aware(dt, timezone.get_current_timezone())
-    return dt
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=_LOCAL_TZ)
 
 
 def _validate_tip_input(
@@ -37,12 +40,12 @@ def _validate_tip_input(
     if match is None:
         raise ValidationError("Match is required to create a tip.")
 
-    now = _ensure_aware(at) if at is not None else timezone.now()
+    now = timezone.now() if at is None else _ensure_aware(at)
 
     if home < 0 or away < 0:
         raise ValidationError("Predicted goals must be non-negative integers.")
 
-    if now > match.matchday.deadline_at:
+    if now > matchday_deadline_at(match):
         raise ValidationError("Deadline passed: tip can no longer be created or changed.")
 
 
@@ -63,15 +66,7 @@ def upsert_tip(
         at=at,
     )
 
-    existing = Tip.objects.filter(user=user, match=match).first()
-    if existing is not None:
-        if (
-            existing.home_goals_predicted == home_goals_predicted
-            and existing.away_goals_predicted == away_goals_predicted
-        ):
-            return TipUpsertResult(tip=existing, created=False, updated=False)
-
-    tip, created = Tip.objects.update_or_create(
+    tip, created = Tip.objects.get_or_create(
         user=user,
         match=match,
         defaults={
@@ -79,9 +74,103 @@ def upsert_tip(
             "away_goals_predicted": away_goals_predicted,
         },
     )
+    if created:
+        return TipUpsertResult(tip=tip, created=True, updated=False)
+
+    if (
+        tip.home_goals_predicted == home_goals_predicted
+        and tip.away_goals_predicted == away_goals_predicted
+    ):
+        return TipUpsertResult(tip=tip, created=False, updated=False)
+
+    # Plain UPDATE instead of save(); auto_now is not applied by update(), so set updated_at here.
+    now = timezone.now()
+    Tip.objects.filter(pk=tip.pk).update(
+        home_goals_predicted=home_goals_predicted,
+        away_goals_predicted=away_goals_predicted,
+        updated_at=now,
+    )
+    tip.home_goals_predicted = home_goals_predicted
+    tip.away_goals_predicted = away_goals_predicted
+    tip.updated_at = now
+    return TipUpsertResult(tip=tip, created=False, updated=True)
+
+@transaction.atomic
+def bulk_upsert_tips(
+    *,
+    user,
+    matchday: Matchday,
+    predictions: Mapping[int, tuple[int, int]],
+    at: datetime | None = None,
+) -> list[TipUpsertResult]:
+    """
+    Upsert a user's tips for several matches of one matchday.
+    `predictions` maps match id -> (home_goals_predicted, away_goals_predicted).
+
+    One query for the matchday's matches, one for the existing tips and a single
+    INSERT ... ON CONFLICT for all new/changed tips, instead of upsert_tip per match.
+    """
+    if user is None:
+        raise ValidationError("User is required to create a tip.")
+    if matchday is None:
+        raise ValidationError("Matchday is required to create a tip.")
+
+    now = timezone.now() if at is None else _ensure_aware(at)
+
+    if any(home < 0 or away < 0 for home, away in predictions.values()):
+        raise ValidationError("Predicted goals must be non-negative integers.")
+
+    # All matches of a matchday share its deadline.
+    if now > matchday.deadline_at:
+        raise ValidationError("Deadline passed: tip can no longer be created or changed.")
+
+    match_ids = set(
+        Match.objects
+        .filter(matchday=matchday, pk__in=predictions.keys())
+        .values_list("pk", flat=True)
+    )
+    unknown = predictions.keys() - match_ids
+    if unknown:
+        raise ValidationError(f"Matches {sorted(unknown)} do not belong to matchday {matchday.pk}.")
+
+    existing: dict[int, Tip] = {
+        tip.match_id: tip
+        for tip in Tip.objects.filter(user=user, match_id__in=match_ids)
+    }
+
+    results: list[TipUpsertResult] = []
+    to_upsert: list[Tip] = []
+    changed: list[tuple[Tip, Tip]] = []
+
+    for match_id, (home, away) in predictions.items():
+        current = existing.get(match_id)
+        if current is not None and (current.home_goals_predicted, current.away_goals_predicted) == (home, away):
+            results.append(TipUpsertResult(tip=current, created=False, updated=False))
+            continue
+
+        row = Tip(user=user, match_id=match_id, home_goals_predicted=home, away_goals_predicted=away)
+        to_upsert.append(row)
+        if current is None:
+            results.append(TipUpsertResult(tip=row, created=True, updated=False))
+        else:
+            changed.append((current, row))
+            results.append(TipUpsertResult(tip=current, created=False, updated=True))
+
+    if to_upsert:
+        Tip.objects.bulk_create(
+            to_upsert,
+            update_conflicts=True,
+            unique_fields=["user", "match"],
+            update_fields=["home_goals_predicted", "away_goals_predicted", "updated_at"],
+        )
+
+    for current, row in changed:
+        current.home_goals_predicted = row.home_goals_predicted
+        current.away_goals_predicted = row.away_goals_predicted
+        current.updated_at = row.updated_at
+
+    return results
 
-    updated = (existing is not None) and (not created)
-    return TipUpsertResult(tip=tip, created=created, updated=updated)
 
 def _validate_bonus_tip_input(
     *,
@@ -95,7 +184,7 @@ def _validate_bonus_tip_input(
     if matchday is None:
         raise ValidationError("Matchday is required to create a bonus tip.")
 
-    now = _ensure_aware(at) if at is not None else timezone.now()
+    now = timezone.now() if at is None else _ensure_aware(at)
 
     if minute < 0 or minute > 130:
         raise ValidationError("First goal minute must be between 0 and 130.")
@@ -118,16 +207,24 @@ def upsert_matchday_bonus_tip(
         at=at,
     )
 
-    existing = MatchdayBonusTip.objects.filter(user=user, matchday=matchday).first()
-    if existing is not None and existing.first_goal_minute_predicted == first_goal_minute_predicted:
-        return existing, False, False
-    
-    bonus_tip, created = MatchdayBonusTip.objects.update_or_create(
+    bonus_tip, created = MatchdayBonusTip.objects.get_or_create(
         user=user,
         matchday=matchday,
         defaults={
             "first_goal_minute_predicted": first_goal_minute_predicted,
         },
     )
-    updated = (existing is not None) and (not created)
-    return bonus_tip, created, updated
\ No newline at end of file
+    if created:
+        return bonus_tip, True, False
+
+    if bonus_tip.first_goal_minute_predicted == first_goal_minute_predicted:
+        return bonus_tip, False, False
+
+    now = timezone.now()
+    MatchdayBonusTip.objects.filter(pk=bonus_tip.pk).update(
+        first_goal_minute_predicted=first_goal_minute_predicted,
+        updated_at=now,
+    )
+    bonus_tip.first_goal_minute_predicted = first_goal_minute_predicted
+    bonus_tip.updated_at = now
+    return bonus_tip, False, True
@@ -1,3 +1,87 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django.utils import timezone
+
+from matches.models import League, Match, Matchday, Season, Team
+from tips.models import Tip
+from tips.services import bulk_upsert_tips, upsert_tip
+
+
+class BulkUpsertTipsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username="tipper")
+        season = Season.objects.create(league=League.objects.create(shortcut="bl1"), year=2025)
+        home = Team.objects.create(openligadb_team_id=1, name="Home")
+        away = Team.objects.create(openligadb_team_id=2, name="Away")
+        kickoff = timezone.now() + timedelta(days=2)
+
+        cls.matchday = Matchday.objects.create(season=season, order_id=1, deadline_at=kickoff - timedelta(hours=3))
+        other_matchday = Matchday.objects.create(season=season, order_id=2, deadline_at=kickoff)
+        cls.matches = [
+            Match.objects.create(
+                openligadb_match_id=i,
+                matchday=cls.matchday,
+                kickoff_at=kickoff,
+                home_team=home,
+                away_team=away,
+            )
+            for i in range(1, 4)
+        ]
+        cls.other_match = Match.objects.create(
+            openligadb_match_id=99,
+            matchday=other_matchday,
+            kickoff_at=kickoff,
+            home_team=home,
+            away_team=away,
+        )
+
+    def _predictions(self) -> dict[int, tuple[int, int]]:
+        return {match.pk: (i, 0) for i, match in enumerate(self.matches)}
+
+    def test_creates_updates_and_keeps_tips(self):
+        upsert_tip(user=self.user, match=self.matches[0], home_goals_predicted=0, away_goals_predicted=0)
+        upsert_tip(user=self.user, match=self.matches[1], home_goals_predicted=3, away_goals_predicted=3)
+
+        results = bulk_upsert_tips(user=self.user, matchday=self.matchday, predictions=self._predictions())
+
+        self.assertEqual(
+            [(r.tip.match_id, r.created, r.updated) for r in results],
+            [
+                (self.matches[0].pk, False, False),
+                (self.matches[1].pk, False, True),
+                (self.matches[2].pk, True, False),
+            ],
+        )
+        stored = {
+            match_id: (home, away)
+            for match_id, home, away in Tip.objects.values_list(
+                "match_id", "home_goals_predicted", "away_goals_predicted"
+            )
+        }
+        self.assertEqual(stored, self._predictions())
+
+    def test_rejects_matches_of_another_matchday(self):
+        predictions = {**self._predictions(), self.other_match.pk: (1, 1)}
+
+        with self.assertRaisesMessage(ValidationError, str([self.other_match.pk])):
+            bulk_upsert_tips(user=self.user, matchday=self.matchday, predictions=predictions)
+        self.assertFalse(Tip.objects.exists())
+
+    def test_rejects_negative_goals(self):
+        with self.assertRaises(ValidationError):
+            bulk_upsert_tips(user=self.user, matchday=self.matchday, predictions={self.matches[0].pk: (-1, 0)})
+        self.assertFalse(Tip.objects.exists())
 
-# Create your tests here.
+    def test_rejects_after_deadline(self):
+        with self.assertRaisesMessage(ValidationError, "Deadline passed"):
+            bulk_upsert_tips(
+                user=self.user,
+                matchday=self.matchday,
+                predictions=self._predictions(),
+                at=self.matchday.deadline_at + timedelta(seconds=1),
+            )
+        self.assertFalse(Tip.objects.exists())